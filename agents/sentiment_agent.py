@@ -7,6 +7,7 @@ Analyzes: earnings calls, headlines, analyst revisions, key events.
 from typing import Dict, Any, List, Optional
 import logging
 import os
+import threading
 import requests
 from datetime import datetime, timedelta, timezone
 from agents.base_agent import BaseAgent
@@ -40,6 +41,8 @@ class SentimentAgent(BaseAgent):
         super().__init__("SentimentAgent", config, openai_client)
         self.sentiment_config = config.get('sentiment_agent', {})
         self.enabled = self.sentiment_config.get('enabled', True)
+        # Per-thread scratch space: the same agent may analyze several tickers concurrently
+        self._local = threading.local()
     
     def analyze(self, ticker: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -58,6 +61,9 @@ class SentimentAgent(BaseAgent):
                 'component_scores': {}
             }
         
+        # Clear any sentiment response left over from a previous ticker on this thread
+        self._local.sentiment_analysis_response = None
+
         news_items = data.get('news', [])
         fundamentals = data.get('fundamentals', {})
         
@@ -308,7 +314,7 @@ Provide your analysis after the sentiment score."""
             )
             
             # Store the full response for rationale generation
-            self._sentiment_analysis_response = response
+            self._local.sentiment_analysis_response = response
             
             # Extract sentiment score from response with improved precision
             import re
@@ -607,9 +613,9 @@ Provide your analysis after the sentiment score."""
             return "Limited recent news coverage indicates low market attention and neutral sentiment"
         
         # Check if we have a stored sentiment analysis response from the two-step process
-        if hasattr(self, '_sentiment_analysis_response') and self._sentiment_analysis_response:
+        detailed_analysis = getattr(self._local, 'sentiment_analysis_response', None)
+        if detailed_analysis:
             # Use the detailed analysis from the two-step process
-            detailed_analysis = self._sentiment_analysis_response
             
             # Format article links
             article_links_section = self._format_article_links(news_items)
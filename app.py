@@ -16,7 +16,16 @@ import os
 from pathlib import Path
 import yaml
 import json
+import re
+import threading
 import time
+from collections import deque
+from itertools import islice
+
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except ImportError:  # older/newer Streamlit layouts - worker threads just run without a script context
+    add_script_run_ctx = get_script_run_ctx = None
 
 # Setup page config
 st.set_page_config(
@@ -711,8 +720,9 @@ def initialize_system():
         st.session_state.tier_manager = TierManager()
     tier = st.session_state.tier_manager
 
-    # Check API keys via tier manager
-    if not tier.get_api_key('OPENAI_API_KEY'):
+    # Check API keys via tier manager (OpenAI key resolved once, reused for the client)
+    openai_api_key = tier.get_api_key('OPENAI_API_KEY')
+    if not openai_api_key:
         st.error("OPENAI_API_KEY not found. Please set it in .env file or provide your own key in the sidebar.")
         return False
 
@@ -740,7 +750,7 @@ def initialize_system():
 
         try:
             if OpenAI is not None:
-                openai_client = OpenAI(api_key=tier.get_api_key('OPENAI_API_KEY'))
+                openai_client = OpenAI(api_key=openai_api_key)
                 st.session_state.openai_client = openai_client
             else:
                 st.warning("OpenAI library not available. Please install: pip install openai")
@@ -765,7 +775,7 @@ def initialize_system():
         
         # Initialize analysis time tracking (simple historical average)
         if 'analysis_times' not in st.session_state:
-            st.session_state.analysis_times = []  # List of historical analysis times in seconds
+            st.session_state.analysis_times = deque(maxlen=50)  # Recent analysis times in seconds
         
         st.session_state.initialized = True
         return True
@@ -992,6 +1002,10 @@ def main():
 
 
 
+# Trailing "~Xs" / "~Xm Ys" ETA suffix appended by the orchestrator to progress messages
+_ETA_SUFFIX_RE = re.compile(r'\s*~\d+(?:m\s+\d+)?s\s*$')
+
+
 def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weights,
                       regime_modulation=False, regime_sensitivity="moderate"):
     """Execute stock analysis with progress display.
@@ -999,8 +1013,6 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
     This is extracted from the button handler so it can be called
     from the rerun path (form hidden) or directly.
     """
-    import threading, time, math
-
     # Create empty slots for progress display
     progress_slot = st.empty()
 
@@ -1044,7 +1056,6 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
 
     def _render_progress(slot, bar_pct, message, remaining_secs=None, step_pct=None, completed_steps=None):
         """Render a professional analysis progress card with agent steps and countdown."""
-        import re as _re
         bar_pct = max(0.0, min(100.0, float(bar_pct)))
         bar_pct_int = int(bar_pct)  # for the HTML width
         sp = int(step_pct) if step_pct is not None else bar_pct_int
@@ -1063,7 +1074,7 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
             time_label = "estimating..."
 
         # Strip ~Xs ETA suffix from message (already shown in timer)
-        clean_msg = _re.sub(r'\s*~\d+(?:m\s+\d+)?s\s*$', '', message)
+        clean_msg = _ETA_SUFFIX_RE.sub('', message)
 
         # Separate sequential and parallel steps
         seq_steps = [s for s in _AGENT_STEPS if not s.get("parallel")]
@@ -1247,10 +1258,11 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
         _prog = {
             'mile_pct': 0.0,
             'mile_msg': 'Initializing...',
-            'done': False,
             'result': None,
             'error': None,
         }
+        # Completion flag: set by the worker when it finishes, and wakes the render loop
+        _done_evt = threading.Event()
 
         # Track which agent steps have completed (for parallel execution)
         _completed_steps = set()
@@ -1366,14 +1378,14 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
             except Exception as e:
                 _prog['error'] = e
             finally:
-                _prog['done'] = True
+                _done_evt.set()
 
         thread = threading.Thread(target=_bg, daemon=True)
-        try:
-            from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
-            add_script_run_ctx(thread, get_script_run_ctx())
-        except Exception:
-            pass
+        if add_script_run_ctx is not None:
+            try:
+                add_script_run_ctx(thread, get_script_run_ctx())
+            except Exception:
+                pass
         thread.start()
 
         # ─── Simple linear countdown timer ───
@@ -1386,11 +1398,12 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
         _agents_snapped = False
         display_pct = 0.0
         last_render = 0.0
+        last_render_key = None
         last_tick = time.time()
         start_wall = time.time()
         _phase_ts['start'] = start_wall
 
-        while not _prog['done']:
+        while not _done_evt.is_set():
             now = time.time()
             dt = now - last_tick
             last_tick = now
@@ -1432,18 +1445,21 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
                 display_pct += pct_gap * lerp
             display_pct = max(0.0, min(99.0, display_pct))
 
-            # Render at ~10 fps
+            # Render at ~10 fps, skipping frames that would redraw an identical card
             if now - last_render >= 0.10:
                 if mp >= 42:
                     _completed_steps.add('data')
 
-                _render_progress(slot, display_pct, msg,
-                                 remaining_secs=display_remaining,
-                                 step_pct=mp,
-                                 completed_steps=_completed_steps if _completed_steps else None)
+                render_key = (round(display_pct, 1), int(display_remaining), msg, mp, len(_completed_steps))
+                if render_key != last_render_key:
+                    _render_progress(slot, display_pct, msg,
+                                     remaining_secs=display_remaining,
+                                     step_pct=mp,
+                                     completed_steps=_completed_steps if _completed_steps else None)
+                    last_render_key = render_key
                 last_render = now
 
-            time.sleep(0.05)
+            _done_evt.wait(0.05)
 
         if _prog['error']:
             raise _prog['error']
@@ -1477,7 +1493,9 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
         return result
 
     # Use average total time from step_times.json for the initial countdown display
-    _lp = st.session_state.orchestrator._learned_phases if hasattr(st.session_state, 'orchestrator') and hasattr(st.session_state.orchestrator, '_learned_phases') else {}
+    # Session lookups resolved once per run, not per stock / per worker thread
+    _orchestrator = st.session_state.get('orchestrator')
+    _lp = getattr(_orchestrator, '_learned_phases', None) or {}
     _initial_est = 60.0
 
     _render_progress(progress_slot, 0, "Initializing analysis…",
@@ -1512,9 +1530,6 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
             analysis_duration = end_time - start_time
             st.session_state.analysis_times.append(analysis_duration)
 
-            if len(st.session_state.analysis_times) > 50:
-                st.session_state.analysis_times = st.session_state.analysis_times[-50:]
-
             actual_minutes = int(analysis_duration // 60)
             actual_seconds = int(analysis_duration % 60)
             _render_progress(progress_slot, 100,
@@ -1580,8 +1595,6 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
 
             def _render_multi_progress(slot, bar_pct, message, remaining_secs=None, step_pct=None, completed_steps=None):
                 """Wrapper that renders single-stock progress card + batch header."""
-                import re as _re
-
                 # Build a batch header above the card
                 _completed = idx
                 _elapsed = time.time() - batch_start_time
@@ -1683,10 +1696,10 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
                 _prog = {
                     'mile_pct': 0.0,
                     'mile_msg': 'Initializing...',
-                    'done': False,
                     'result': None,
                     'error': None,
                 }
+                _done_evt_m = threading.Event()
                 _completed_steps_m = set()
 
                 _STEP_COMPLETE_MAP_M = {
@@ -1705,7 +1718,7 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
                 }
 
                 # --- Per-step expected timing (multi-point recalibration) ---
-                _lp_m = st.session_state.orchestrator._learned_phases if hasattr(st.session_state.orchestrator, '_learned_phases') else {}
+                _lp_m = _lp
                 _est_data_wall_m = _lp_m.get('data_gather', 45.0)
                 _est_agents_wall_m = _lp_m.get('agents_wall_p75', _lp_m.get('agents', 20.0))
                 _est_blend_m = _lp_m.get('blend', 1.0)
@@ -1758,8 +1771,7 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
 
                 def _bg_m():
                     try:
-                        orchestrator = st.session_state.orchestrator
-                        _prog['result'] = orchestrator.analyze_stock(
+                        _prog['result'] = _orchestrator.analyze_stock(
                             ticker=stock_ticker,
                             analysis_date=date_str,
                             agent_weights=agent_weights,
@@ -1770,14 +1782,14 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
                     except Exception as e:
                         _prog['error'] = e
                     finally:
-                        _prog['done'] = True
+                        _done_evt_m.set()
 
                 thread = threading.Thread(target=_bg_m, daemon=True)
-                try:
-                    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
-                    add_script_run_ctx(thread, get_script_run_ctx())
-                except Exception:
-                    pass
+                if add_script_run_ctx is not None:
+                    try:
+                        add_script_run_ctx(thread, get_script_run_ctx())
+                    except Exception:
+                        pass
                 thread.start()
 
                 # ─── Simple linear countdown timer (same as single-stock) ───
@@ -1786,11 +1798,12 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
                 _agents_snapped_m = False
                 display_pct_m = 0.0
                 last_render_m = 0.0
+                last_render_key_m = None
                 last_tick_m = time.time()
                 start_wall_m = time.time()
                 _phase_ts_m['start'] = start_wall_m
 
-                while not _prog['done']:
+                while not _done_evt_m.is_set():
                     now = time.time()
                     dt = now - last_tick_m
                     last_tick_m = now
@@ -1834,15 +1847,20 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
                         if mp >= 42:
                             _completed_steps_m.add('data')
 
-                        _render_multi_progress(
-                            _batch_header_slot, display_pct_m, msg,
-                            remaining_secs=display_remaining_m,
-                            step_pct=mp,
-                            completed_steps=_completed_steps_m if _completed_steps_m else None
-                        )
+                        # Batch header shows whole seconds, so include them in the key
+                        render_key_m = (round(display_pct_m, 1), int(display_remaining_m), msg, mp,
+                                        len(_completed_steps_m), int(now - batch_start_time))
+                        if render_key_m != last_render_key_m:
+                            _render_multi_progress(
+                                _batch_header_slot, display_pct_m, msg,
+                                remaining_secs=display_remaining_m,
+                                step_pct=mp,
+                                completed_steps=_completed_steps_m if _completed_steps_m else None
+                            )
+                            last_render_key_m = render_key_m
                         last_render_m = now
 
-                    time.sleep(0.05)
+                    _done_evt_m.wait(0.05)
 
                 if _prog['error']:
                     raise _prog['error']
@@ -1871,11 +1889,10 @@ def _execute_analysis(analysis_mode, ticker, tickers, analysis_date, agent_weigh
                 # Track time for this stock
                 stock_duration = time.time() - stock_start_time
                 st.session_state.analysis_times.append(stock_duration)
-                if len(st.session_state.analysis_times) > 50:
-                    st.session_state.analysis_times = st.session_state.analysis_times[-50:]
 
-                # Update per-stock estimate for next stock
-                avg_time_per_stock = sum(st.session_state.analysis_times[-5:]) / len(st.session_state.analysis_times[-5:])
+                # Update per-stock estimate for next stock (last 5 runs)
+                recent_times = list(islice(reversed(st.session_state.analysis_times), 5))
+                avg_time_per_stock = sum(recent_times) / len(recent_times)
 
                 # Show completion briefly
                 actual_m = int(stock_duration // 60)
@@ -11,6 +11,8 @@ from alpha_vantage.fundamentaldata import FundamentalData
 from alpha_vantage.timeseries import TimeSeries
 from newsapi import NewsApiClient
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import logging
@@ -41,7 +43,8 @@ class EnhancedDataProvider:
         alpha_vantage_key: Optional[str] = None,
         news_api_key: Optional[str] = None,
         polygon_key: Optional[str] = None,
-        cache_dir: str = "data/cache"
+        cache_dir: str = "data/cache",
+        session: Optional[requests.Session] = None
     ):
         # API Keys - NO IEX DEPENDENCY
         self.av_key = alpha_vantage_key or os.getenv("ALPHA_VANTAGE_API_KEY")
@@ -50,6 +53,9 @@ class EnhancedDataProvider:
         self.perplexity_key = os.getenv("PERPLEXITY_API_KEY")
         self.openai_key = os.getenv("OPENAI_API_KEY")
         
+        # Shared HTTP session: keeps TCP/TLS connections alive across requests and tickers
+        self.session = session or self._build_session()
+        
         # Cache setup
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -70,6 +76,20 @@ class EnhancedDataProvider:
         # Fallback data for emergencies
         self._load_emergency_data()
     
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Create a pooled session sized for concurrent per-ticker fan-out."""
+        session = requests.Session()
+        # Connection-level retries only; HTTP/status retries stay with _smart_retry
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, read=False, status=None, backoff_factor=0.3)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
     def _initialize_apis(self):
         """Initialize all available APIs."""
         logger.info("Starting simplified API initialization...")
@@ -178,7 +198,7 @@ class EnhancedDataProvider:
         try:
             if data_type == 'ticker_details':
                 url = f"{base_url}/v3/reference/tickers/{ticker.upper()}"
-                response = requests.get(url, headers=headers, timeout=10)
+                response = self.session.get(url, headers=headers, timeout=10)
                 
             elif data_type == 'daily_prices':
                 # Get last 30 days of data - USE PROPER CURRENT DATE
@@ -188,12 +208,12 @@ class EnhancedDataProvider:
                 end_date = today.strftime('%Y-%m-%d')
                 start_date = (today - timedelta(days=60)).strftime('%Y-%m-%d')
                 url = f"{base_url}/v2/aggs/ticker/{ticker.upper()}/range/1/day/{start_date}/{end_date}"
-                response = requests.get(url, headers=headers, timeout=10)
+                response = self.session.get(url, headers=headers, timeout=10)
                 
             elif data_type == 'financials':
                 url = f"{base_url}/vX/reference/financials"
                 params = {"ticker": ticker.upper(), "limit": 1}
-                response = requests.get(url, headers=headers, params=params, timeout=10)
+                response = self.session.get(url, headers=headers, params=params, timeout=10)
             
             else:
                 return None
@@ -247,7 +267,7 @@ class EnhancedDataProvider:
                 "temperature": 0.1
             }
             
-            response = requests.post(url, headers=headers, json=payload, timeout=45)
+            response = self.session.post(url, headers=headers, json=payload, timeout=45)
             
             if response.status_code == 200:
                 self._record_request('perplexity')
@@ -846,7 +866,7 @@ Do NOT include labels, units, or explanation. Just three comma-separated numbers
                 agg_url = f"https://api.polygon.io/v2/aggs/ticker/{ticker}/range/1/day/{start_date}/{end_date}"
                 headers = {"Authorization": f"Bearer {self.polygon_key}"}
                 
-                response = requests.get(agg_url, headers=headers, timeout=10)
+                response = self.session.get(agg_url, headers=headers, timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     if 'results' in data and data['results']:
@@ -866,7 +886,7 @@ Do NOT include labels, units, or explanation. Just three comma-separated numbers
                     financials_url = f"https://api.polygon.io/vX/reference/financials?ticker={ticker}&limit=1"
                     headers = {"Authorization": f"Bearer {self.polygon_key}"}
                     
-                    response = requests.get(financials_url, headers=headers, timeout=10)
+                    response = self.session.get(financials_url, headers=headers, timeout=10)
                     if response.status_code == 200:
                         data = response.json()
                         if 'results' in data and data['results']:
@@ -1098,7 +1118,7 @@ Do NOT include labels, units, or explanation. Just three comma-separated numbers
                 "max_tokens": 2500
             }
             
-            response = requests.post(url, json=payload, headers=headers, timeout=45)
+            response = self.session.post(url, json=payload, headers=headers, timeout=45)
             
             if response.status_code == 200:
                 self._record_request('perplexity')
@@ -1429,7 +1449,7 @@ Do NOT include labels, units, or explanation. Just three comma-separated numbers
                 'apikey': self.av_key
             }
             
-            response = requests.get(url, params=params, timeout=15)
+            response = self.session.get(url, params=params, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -1561,7 +1581,7 @@ Do NOT include labels, units, or explanation. Just three comma-separated numbers
                 'temperature': 0.1
             }
             
-            response = requests.post(
+            response = self.session.post(
                 'https://api.perplexity.ai/chat/completions',
                 headers=headers,
                 json=payload,
@@ -1616,7 +1636,7 @@ Do NOT include labels, units, or explanation. Just three comma-separated numbers
             }
             
             logger.info(f"Making focused Perplexity query for {ticker} ({query_type})")
-            response = requests.post(
+            response = self.session.post(
                 'https://api.perplexity.ai/chat/completions',
                 headers=headers,
                 json=payload,
@@ -2030,7 +2050,7 @@ Do NOT include labels, units, or explanation. Just three comma-separated numbers
                 "temperature": 0.1
             }
             
-            response = requests.post(
+            response = self.session.post(
                 "https://api.perplexity.ai/chat/completions",
                 json=payload,
                 headers=headers,
@@ -2590,7 +2610,7 @@ Example: {{"price": 150.25, "pe_ratio": 28.5, "beta": 1.2}}"""
         url = f"https://api.polygon.io/v2/aggs/ticker/{ticker}/range/1/day/{start_date}/{end_date}"
         params = {'apikey': self.polygon_key}
         
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -2674,15 +2694,19 @@ Example: {{"price": 150.25, "pe_ratio": 28.5, "beta": 1.2}}"""
         return df.fillna(0)
     
     def get_fundamentals_enhanced(self, ticker: str, cache_hours: float = 0.0) -> Dict[str, Any]:
-        """Get comprehensive fundamental data using Polygon, Perplexity, and intelligent analysis."""
+        """Get comprehensive fundamental data using Polygon, Perplexity, and intelligent analysis.
+
+        cache_hours > 0 serves a previously retrieved result younger than that
+        from the on-disk cache; the default (0) always fetches fresh data.
+        """
         logger.info(f"=== STARTING FUNDAMENTALS RETRIEVAL FOR {ticker} ===")
         
-        # DISABLE CACHING COMPLETELY FOR DEBUGGING
-        # cache_key = f"comprehensive_data_{ticker}"
-        # cached = self._load_cache(cache_key, cache_hours)
-        # if cached is not None:
-        #     logger.info(f"Using cached data for {ticker}")
-        #     return cached
+        cache_key = f"comprehensive_data_{ticker}"
+        if cache_hours > 0:
+            cached = self._load_cache(cache_key, cache_hours)
+            if cached is not None:
+                logger.info(f"Using cached data for {ticker}")
+                return cached
         
         # Use the new comprehensive method
         try:
@@ -2734,8 +2758,9 @@ Example: {{"price": 150.25, "pe_ratio": 28.5, "beta": 1.2}}"""
             
             logger.info(f"FINAL FUNDAMENTALS STRUCTURE: {fundamentals}")
             
-            # Save to cache - DISABLED FOR DEBUGGING
-            # self._save_cache(cache_key, fundamentals)
+            # Only real (non-synthetic) results are cached
+            if cache_hours > 0:
+                self._save_cache(cache_key, fundamentals)
             
             logger.info(f"Comprehensive fundamentals retrieved for {ticker} using: {fundamentals['data_sources']}")
             return fundamentals
@@ -2843,7 +2868,7 @@ Example: {{"price": 150.25, "pe_ratio": 28.5, "beta": 1.2}}"""
             
             logger.info(f"Polygon: Fetching 52-week range for {ticker} ({start_str} to {end_str})")
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
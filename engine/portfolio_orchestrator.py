@@ -7,12 +7,21 @@ Handles position sizing and portfolio construction.
 from typing import Dict, List, Any, Tuple
 import pandas as pd
 import numpy as np
+import copy
+import hashlib
+import heapq
 import json
 import os
+import pickle
 import logging
 import time
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import date, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from statistics import median as _median, quantiles as _quantiles
 
 from agents.value_agent import ValueAgent
@@ -25,6 +34,31 @@ from engine.ai_portfolio_selector import AIPortfolioSelector
 
 logger = logging.getLogger(__name__)
 
+# Section separators for the plain-text rationale
+_SEP_EQ = "=" * 80
+_SEP_DASH = "-" * 80
+
+# KEY FINANCIAL METRICS rows: (label, fundamentals key, formatter); falsy values are skipped
+_RATIONALE_METRICS = (
+    ('Current Price', 'price', lambda v: f"${v:.2f}"),
+    # Rationale keeps its own $T/$B/$M scale: caps under $1B always print in millions
+    ('Market Cap', 'market_cap', lambda v: (
+        f"${v/1e12:.2f}T" if v >= 1e12 else f"${v/1e9:.2f}B" if v >= 1e9 else f"${v/1e6:.2f}M"
+    )),
+    ('P/E Ratio', 'pe_ratio', lambda v: f"{v:.2f}"),
+    ('Beta', 'beta', lambda v: f"{v:.2f}"),
+    ('Dividend Yield', 'dividend_yield', lambda v: f"{v*100:.2f}%"),
+)
+
+# Agent sections of the rationale, in display order
+_RATIONALE_SECTIONS = (
+    ('value_agent', 'VALUE ANALYSIS'),
+    ('growth_momentum_agent', 'GROWTH ANALYSIS'),
+    ('macro_regime_agent', 'MACROECONOMIC ANALYSIS'),
+    ('risk_agent', 'RISK ASSESSMENT'),
+    ('sentiment_agent', 'MARKET SENTIMENT ANALYSIS'),
+)
+
 
 def _load_learned_phase_durations() -> dict:
     """Load phase durations from data/step_times.json.
@@ -105,6 +139,166 @@ def _load_learned_phase_durations() -> dict:
         return defaults
 
 
+# Shape-invariant draws for synthetic price history; only the scaling varies per ticker
+_SYNTH_RNG = np.random.default_rng(42)
+_SYNTH_NORM_NOISE = _SYNTH_RNG.standard_normal(252)
+_SYNTH_VOLUME = _SYNTH_RNG.integers(1000000, 5000000, 252)
+_SYNTH_NORM_NOISE.setflags(write=False)
+_SYNTH_VOLUME.setflags(write=False)
+
+
+@lru_cache(maxsize=4)
+def _synthetic_date_index(end_day: date, periods: int) -> pd.DatetimeIndex:
+    """Daily index ending on end_day, shared by every synthetic series built that day."""
+    return pd.date_range(end=pd.Timestamp(end_day), periods=periods, freq='D', name='Date')
+
+
+@lru_cache(maxsize=64)
+def _resolve_date_range(analysis_date: str, today: date) -> Tuple[str, str]:
+    """(start, end) ISO dates for the 1-year lookback ending on analysis_date.
+
+    The end is clamped to today so future dates don't break API calls; today
+    is part of the key so the clamp stays correct across midnight.
+    """
+    end = min(date.fromisoformat(analysis_date), today)
+    try:
+        start = end.replace(year=end.year - 1)
+    except ValueError:  # Feb 29 -> Feb 28, same as pd.DateOffset(years=1)
+        start = end.replace(year=end.year - 1, day=28)
+    return start.isoformat(), end.isoformat()
+
+
+@lru_cache(maxsize=256)
+def _phase_remaining(progress_pct: float, durations: Tuple[float, float, float]):
+    """Seconds left across the data/agents/blend phases at progress_pct (None when done)."""
+    # Phase definitions: (start_pct, end_pct, learned_duration_seconds)
+    phases = (
+        (0,  42, durations[0]),   # Data gathering
+        (42, 98, durations[1]),   # Agent analysis (parallel)
+        (98, 100, durations[2]),  # Finalization
+    )
+
+    # Find current phase and calculate remaining time
+    remaining = 0.0
+    found_current = False
+
+    for start_pct, end_pct, duration in phases:
+        if not found_current:
+            if progress_pct < end_pct:
+                # We're in this phase
+                found_current = True
+                phase_progress = (progress_pct - start_pct) / (end_pct - start_pct) if end_pct > start_pct else 1.0
+                phase_progress = max(0.0, min(1.0, phase_progress))
+                remaining += duration * (1.0 - phase_progress)
+            # else: we've passed this phase, skip it
+        else:
+            # Future phase - add full duration
+            remaining += duration
+
+    return remaining if found_current else None
+
+
+@lru_cache(maxsize=512)
+def _format_eta(secs: int) -> str:
+    """ETA suffix appended to progress messages."""
+    if secs < 60:
+        return f" ~{secs}s"
+    mins = secs // 60
+    return f" ~{mins}m {secs % 60}s"
+
+
+def _simple_returns(prices: np.ndarray) -> np.ndarray:
+    """Period-over-period returns of a price array; same values as Series.pct_change()."""
+    returns = np.empty_like(prices, dtype=np.float64)
+    returns[:1] = np.nan
+    returns[1:] = prices[1:] / prices[:-1] - 1.0
+    return returns
+
+
+@lru_cache(maxsize=64)
+def _benchmark_df_cached(benchmark_ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Build the synthetic benchmark series for a date window (memoized)."""
+    # Create simple synthetic S&P 500 data
+    # Business days only: ~252 trading sessions a year, like a real index series
+    dates = pd.date_range(start=start_date, end=end_date, freq='B', name='Date')
+    
+    # Generate synthetic benchmark returns with realistic characteristics
+    rng = np.random.default_rng(42)  # Reproducible; private generator, safe across threads
+    daily_returns = 0.0005 + 0.01 * rng.standard_normal(len(dates))  # ~0.05% daily return, 1% volatility
+    
+    # Start at a reasonable level (e.g., 4000 for S&P 500) and compound the
+    # returns in one vectorized pass (first day has no return applied)
+    start_price = 4000
+    daily_returns[:1] = 0.0
+    prices = start_price * np.cumprod(1.0 + daily_returns)
+    
+    # Returns column that the risk agent expects
+    returns = _simple_returns(prices)
+    
+    # Create the DataFrame directly on the date index
+    return pd.DataFrame({
+        'Close': prices,
+        'High': prices * 1.005,
+        'Low': prices * 0.995,
+        'Volume': rng.integers(3000000000, 5000000000, len(dates)),
+        'Returns': returns
+    }, index=dates)
+
+
+def _data_digest(data: Dict[str, Any]):
+    """Stable digest of gathered data (fundamentals + price summary) for agent-cache keys.
+
+    Returns None when the data can't be summarized, in which case agent
+    results are not cached.
+    """
+    try:
+        history = data.get('price_history')
+        price_summary = None
+        if isinstance(history, pd.DataFrame) and not history.empty:
+            close = history['Close'] if 'Close' in history.columns else history.iloc[:, 0]
+            price_summary = [len(history), str(history.index[0]), str(history.index[-1]),
+                             float(close.iloc[-1]), float(close.sum())]
+        payload = json.dumps([data.get('fundamentals') or {}, price_summary],
+                             sort_keys=True, default=str)
+    except Exception as e:
+        logger.debug(f"Could not digest gathered data: {e}")
+        return None
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache with per-entry expiry (exact-key lookups)."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
 class PortfolioOrchestrator:
     """
     Main orchestration engine for the multi-agent investment system.
@@ -113,6 +307,13 @@ class PortfolioOrchestrator:
 
     # Learned phase durations loaded once at import time
     _learned_phases: dict = _load_learned_phase_durations()
+
+    # Bump when the shape or meaning of a cached analysis changes
+    ANALYSIS_CACHE_VERSION = 2
+
+    # Lifetimes for the in-process caches (seconds)
+    DATA_CACHE_TTL = 3600        # gathered market data
+    AGENT_CACHE_TTL = 24 * 3600  # per-agent scores/rationales
     
     def __init__(
         self,
@@ -128,6 +329,37 @@ class PortfolioOrchestrator:
         self.openai_client = openai_client
         self.gemini_api_key = gemini_api_key
         logger.info("Using Enhanced Data Provider with premium fallbacks")
+
+        # Long-lived pool for data-gathering I/O so worker threads (and any
+        # keep-alive connections they hold) are reused across tickers
+        self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='orch-io')
+        # Long-lived pool for agent analyze() calls, shared by concurrent tickers
+        # (default: 5 agents x 8 tickers, so analyze_many never waits on it)
+        self._agent_pool = ThreadPoolExecutor(
+            max_workers=max(1, int(os.getenv('AGENT_MAX_CONCURRENCY', '40'))),
+            thread_name_prefix='orch-agent'
+        )
+        # Caps in-flight provider calls across concurrently analyzed tickers so
+        # bursts don't trip upstream rate limits (429 retry storms)
+        self._api_sema = threading.Semaphore(max(1, int(os.getenv('API_MAX_CONCURRENCY', '6'))))
+        # Max age (hours) of on-disk fundamentals the provider may reuse; 0 = always fetch
+        self._fundamentals_cache_hours = float(os.getenv('FUNDAMENTALS_CACHE_HOURS', '0'))
+
+        # In-process caches so re-scoring the same ticker/date (e.g. weight sweeps)
+        # reuses gathered data and agent outputs instead of repeating API/LLM calls
+        self._data_cache = _TTLCache(maxsize=128, ttl_seconds=self.DATA_CACHE_TTL)
+        self._agent_cache = _TTLCache(maxsize=1024, ttl_seconds=self.AGENT_CACHE_TTL)
+
+        # Optional on-disk cache of finished analyses for past (fixed-window) dates
+        cache_dir = os.getenv('ANALYSIS_CACHE_DIR')
+        self._analysis_cache_dir = Path(cache_dir) if cache_dir else None
+        if self._analysis_cache_dir is not None:
+            self._analysis_cache_dir.mkdir(parents=True, exist_ok=True)
+        # Cache entries are keyed on the format version and the configs that drive
+        # scoring (weights, IPS rules, models), so a config change starts fresh
+        config_json = json.dumps([self.ANALYSIS_CACHE_VERSION, model_config, ips_config],
+                                 sort_keys=True, default=str)
+        self._analysis_cache_tag = hashlib.blake2b(config_json.encode(), digest_size=8).hexdigest()
         
         # Initialize agents with their dependencies
         self.agents = {}
@@ -159,8 +391,140 @@ class PortfolioOrchestrator:
             'risk_agent': agent_weights_config.get('risk', 0.15),  # Reduced - upside > downside protection
             'sentiment_agent': agent_weights_config.get('sentiment', 0.15)  # Market momentum matters
         }
+        # Frozen (agent, weight) pairs iterated by _blend_scores for the default weights
+        self._weight_items = tuple(self.agent_weights.items())
+        # Per-thread scratch state so concurrent analyses don't see each other's blend details
+        self._local = threading.local()
         
+        # IPS eligibility thresholds (resolved once; checked for every ticker)
+        universe_cfg = ips_config.get('universe', {})
+        constraints_cfg = ips_config.get('portfolio_constraints', {})
+        self._min_price = universe_cfg.get('min_price', 1.0)
+        self._min_market_cap = universe_cfg.get('min_market_cap', 0)
+        self._beta_min = constraints_cfg.get('beta_min', 0)
+        self._beta_max = constraints_cfg.get('beta_max', 999)
+        self._excluded_sectors = frozenset(
+            s.lower() for s in ips_config.get('exclusions', {}).get('sectors', [])
+        )
+
         logger.info(f"Portfolio Orchestrator initialized with UPSIDE-FOCUSED weights: {self.agent_weights}")
+
+    # Display labels used in agent progress messages
+    AGENT_LABELS = {
+        'value_agent': 'Value',
+        'growth_momentum_agent': 'Growth',
+        'macro_regime_agent': 'Macro Regime',
+        'risk_agent': 'Risk',
+        'sentiment_agent': 'Sentiment'
+    }
+
+    # Simplified weight names (UI / IPS config) -> internal agent names
+    _WEIGHT_MAPPING = {
+        'value': 'value_agent',
+        'growth_momentum': 'growth_momentum_agent',
+        'macro_regime': 'macro_regime_agent',
+        'risk': 'risk_agent',
+        'sentiment': 'sentiment_agent'
+    }
+
+    def _resolve_weights(self, overrides: Dict[str, float] = None) -> Dict[str, float]:
+        """Agent weights with custom overrides applied (self.agent_weights is never mutated)."""
+        if not overrides:
+            return self.agent_weights
+
+        weights = dict(self.agent_weights)
+        for simplified_name, weight in overrides.items():
+            agent_name = self._WEIGHT_MAPPING.get(simplified_name, simplified_name)
+            if agent_name in weights:
+                weights[agent_name] = weight
+        return weights
+
+    def _guarded(self, fn, *args, **kwargs):
+        """Run a data-provider call while holding the API concurrency semaphore."""
+        with self._api_sema:
+            return fn(*args, **kwargs)
+    
+    def _analysis_cache_file(self, ticker: str, analysis_date: str):
+        """Cache path for a default-configuration analysis, or None if not cacheable.
+
+        Only past dates are cached: their 1-year data window is fixed, whereas
+        a window ending today still moves with the market.
+        """
+        if self._analysis_cache_dir is None:
+            return None
+        try:
+            if date.fromisoformat(str(analysis_date)[:10]) >= date.today():
+                return None
+        except ValueError:
+            return None
+        key = f"analysis_{ticker}_{str(analysis_date)[:10]}_{self._analysis_cache_tag}".replace('/', '_')
+        return self._analysis_cache_dir / f"{key}.pkl"
+
+    def _load_analysis_cache(self, cache_file) -> Dict[str, Any]:
+        """Load a cached analysis result, if present."""
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load analysis cache {cache_file.name}: {e}")
+            return None
+
+    def _save_analysis_cache(self, cache_file, result: Dict[str, Any]):
+        """Persist an analysis result to the on-disk cache."""
+        if cache_file is None:
+            return
+        # Write to a per-thread temp file and swap it in, so a crash never leaves a
+        # truncated entry and concurrent writers of the same key don't interleave
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(result, f)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to save analysis cache {cache_file.name}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _ips_ineligible_result(ticker: str, fundamentals: Dict[str, Any]) -> Dict[str, Any]:
+        """Analysis result for a ticker the IPS pre-screen rules out (no agent scores)."""
+        return {
+            'ticker': ticker,
+            'error': 'ips_ineligible',
+            'fundamentals': fundamentals,
+            'price_history': {},
+            'agent_results': {},
+            'agent_scores': {},
+            'agent_rationales': {},
+            'blended_score': 0,
+            'final_score': 0,
+            'eligible': False,
+        }
+
+    def clear_caches(self):
+        """Drop the in-process data/agent caches and the on-disk analysis cache (forces fresh API/LLM calls)."""
+        self._data_cache.clear()
+        self._agent_cache.clear()
+        if self._analysis_cache_dir is not None:
+            for cache_file in self._analysis_cache_dir.glob("analysis_*.pkl"):
+                try:
+                    cache_file.unlink()
+                except OSError as e:
+                    logger.warning(f"Failed to remove analysis cache {cache_file.name}: {e}")
+
+    def close(self):
+        """Release the shared I/O and agent thread pools."""
+        for attr in ('_io_pool', '_agent_pool'):
+            pool = getattr(self, attr, None)
+            if pool is not None:
+                pool.shutdown(wait=False)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def analyze_single_stock(
         self,
@@ -171,6 +535,7 @@ class PortfolioOrchestrator:
         progress_callback=None,
         regime_modulation: bool = False,
         regime_sensitivity: str = "moderate",
+        ips_prefilter: bool = False,
     ) -> Dict[str, Any]:
         """
         Analyze a single stock using all agents.
@@ -179,11 +544,30 @@ class PortfolioOrchestrator:
             progress_callback: Optional callable(progress_pct: float, message: str)
                 that receives progress updates. The progress_pct is 0-100 and
                 message includes the ETA suffix.
+            ips_prefilter: If True, check IPS eligibility as soon as fundamentals
+                arrive and skip the agent phase for ineligible tickers.
 
         Returns complete analysis with scores, rationale, and recommendations.
         """
         logger.info(f"Starting comprehensive analysis for {ticker} as of {analysis_date}")
 
+        # Default-configuration runs on past dates are deterministic in their inputs,
+        # so repeat invocations (e.g. while tuning) can reuse the stored result
+        cache_file = None
+        if not (agent_weights or regime_modulation or existing_portfolio):
+            cache_file = self._analysis_cache_file(ticker, analysis_date)
+            cached = self._load_analysis_cache(cache_file)
+            if cached is not None:
+                logger.info(f"Using cached analysis for {ticker} as of {analysis_date}")
+                # The stored result predates this call's IPS screen; apply it here too
+                cached_fundamentals = cached.get('fundamentals') or {}
+                if ips_prefilter and not self._check_ips_eligibility(ticker, cached_fundamentals, 0):
+                    logger.info(f"{ticker} fails IPS eligibility screen — ignoring cached analysis")
+                    return self._ips_ineligible_result(ticker, cached_fundamentals)
+                if progress_callback:
+                    progress_callback(100, f"Analysis complete: {cached.get('final_score', 0):.1f}/100 (cached)")
+                return cached
+
         # Phase durations loaded from data/step_times.json (learned from timing runs)
         lp = PortfolioOrchestrator._learned_phases
         # Phase 1: Data gathering   0-42%  (~{lp['data_gather']}s)
@@ -219,24 +603,6 @@ class PortfolioOrchestrator:
             except Exception as e:
                 logger.error(f"Progress update failed: {e}")
         
-        # Set agent weights for this analysis if provided
-        if agent_weights:
-            # Map the simplified names to agent names used in the system
-            weight_mapping = {
-                'value': 'value_agent',
-                'growth_momentum': 'growth_momentum_agent',
-                'macro_regime': 'macro_regime_agent',
-                'risk': 'risk_agent',
-                'sentiment': 'sentiment_agent'
-            }
-            
-            # Apply weights
-            original_weights = self.agent_weights.copy()
-            for simplified_name, weight in agent_weights.items():
-                agent_name = weight_mapping.get(simplified_name, simplified_name)
-                if agent_name in self.agent_weights:
-                    self.agent_weights[agent_name] = weight
-        
         # 1. Gather all data (Phase 1: 0-42%)
         update_progress(f"Fetching data for {ticker} from multiple sources...", 3)
 
@@ -249,19 +615,25 @@ class PortfolioOrchestrator:
                 Also advances the progress bar from 3% to 40%.
                 """
                 _data_cb_count[0] += 1
-                # 4 callbacks expected: 1 initial + 3 task completions
+                # Up to 4 callbacks expected: 1 initial + 2-3 task completions
                 # Map to 3% -> 40% range
                 pct = int(3 + (_data_cb_count[0] / 4) * 37)
                 pct = min(pct, 40)
                 update_progress(msg, pct)
 
-            data = self._gather_data(ticker, analysis_date, existing_portfolio,
-                                     progress_callback=data_progress_cb,
-                                     step_timings=_step_timings)
+            data_cache_key = (ticker, str(analysis_date)[:10])
+            data = self._data_cache.get(data_cache_key) if data_cache_key else None
+            data_from_cache = data is not None
+            if data_from_cache:
+                logger.info(f"Using cached data for {ticker} as of {analysis_date}")
+                data = dict(data)
+                data['existing_portfolio'] = existing_portfolio or []
+            else:
+                data = self._gather_data(ticker, analysis_date, existing_portfolio,
+                                         progress_callback=data_progress_cb,
+                                         step_timings=_step_timings)
         except Exception as e:
-            logger.error(f"Error gathering data for {ticker}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error gathering data for {ticker}: {e}")
             return {
                 'ticker': ticker,
                 'error': f'Data gathering failed: {str(e)}',
@@ -319,30 +691,24 @@ class PortfolioOrchestrator:
                 'eligible': False,
             }
 
+        if data_cache_key and not data_from_cache:
+            self._data_cache.set(data_cache_key, data)
+
+        # ── IPS pre-screen: don't spend agent/LLM calls on tickers the IPS rules out ──
+        if ips_prefilter and not self._check_ips_eligibility(ticker, fundamentals, 0):
+            logger.info(f"{ticker} fails IPS eligibility screen — skipping agent analysis")
+            return self._ips_ineligible_result(ticker, fundamentals)
+
         # Show specific extracted values
         price = fundamentals.get('price', 'N/A')
-        eps = fundamentals.get('eps', 'N/A')
         pe_ratio = fundamentals.get('pe_ratio', 'N/A')
-        market_cap = fundamentals.get('market_cap', 'N/A')
-        
-        # Format market cap for readability
-        if isinstance(market_cap, (int, float)) and market_cap > 0:
-            if market_cap >= 1e12:
-                market_cap_str = f"${market_cap/1e12:.1f}T"
-            elif market_cap >= 1e9:
-                market_cap_str = f"${market_cap/1e9:.1f}B"
-            elif market_cap >= 1e6:
-                market_cap_str = f"${market_cap/1e6:.1f}M"
-            else:
-                market_cap_str = f"${market_cap:,.0f}"
-        else:
-            market_cap_str = "N/A"
-        
+        market_cap_str = self._format_market_cap(fundamentals.get('market_cap'))
+
         update_progress(f"Data ready: ${price} price, {pe_ratio} P/E, {market_cap_str} mkt cap", 42)
 
         # 2. Phase 2: Run agents IN PARALLEL (42-98%)
         # For ETFs, skip Value and Growth agents (P/E, EPS growth are meaningless)
-        is_etf = data.get('fundamentals', {}).get('is_etf', False)
+        is_etf = fundamentals.get('is_etf', False)
         _etf_skip = {'value_agent', 'growth_momentum_agent'} if is_etf else set()
 
         agents_to_run = {
@@ -356,72 +722,90 @@ class PortfolioOrchestrator:
         agent_results = {}
         total_agents = len(agents_to_run)
 
-        agent_labels_map = {
-            'value_agent': 'Value',
-            'growth_momentum_agent': 'Growth',
-            'macro_regime_agent': 'Macro Regime',
-            'risk_agent': 'Risk',
-            'sentiment_agent': 'Sentiment'
-        }
-
         update_progress(f"Running {total_agents} agents in parallel...", 43)
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_agent = {}
-            _agent_start_times = {}
-            for i, (agent_name, agent) in enumerate(agents_to_run.items()):
+        # Agents run on the orchestrator's long-lived agent pool (no per-analysis
+        # thread churn); its size caps concurrent LLM calls across tickers
+        executor = self._agent_pool
+        future_to_agent = {}
+        _agent_start_times = {}
+        # Agent outputs are reusable for the same ticker/date and input data unless
+        # they depend on holdings; the data digest keeps a re-fetch from serving
+        # scores computed on older fundamentals
+        agent_cache_keys = {}
+        data_digest = _data_digest(data) if data_cache_key and not existing_portfolio else None
+        launched = 0
+        for agent_name, agent in agents_to_run.items():
+            _agent_start_times[agent_name] = time.time()
+            cache_key = None
+            if data_digest:
+                cache_key = (agent_name,) + data_cache_key + (data_digest,)
+            cached = self._agent_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                # Hand out a copy so callers annotating results can't alter the cache
+                future = Future()
+                future.set_result(copy.deepcopy(cached))
+            else:
                 # Small stagger between agent launches to avoid API burst
-                if i > 0:
+                if launched > 0:
                     time.sleep(0.2)
-                _agent_start_times[agent_name] = time.time()
+                launched += 1
                 future = executor.submit(agent.analyze, ticker, data)
-                future_to_agent[future] = agent_name
+                agent_cache_keys[agent_name] = cache_key
+            future_to_agent[future] = agent_name
 
-            completed_count = 0
-            for future in as_completed(future_to_agent):
-                agent_name = future_to_agent[future]
-                agent_elapsed = time.time() - _agent_start_times[agent_name]
-                completed_count += 1
-                agent_label = agent_labels_map.get(agent_name, agent_name.replace('_agent', '').title())
+        completed_count = 0
+        agents_failed = False
+        for future in as_completed(future_to_agent):
+            agent_name = future_to_agent[future]
+            agent_elapsed = time.time() - _agent_start_times[agent_name]
+            completed_count += 1
+            agent_label = self.AGENT_LABELS.get(agent_name) or agent_name.replace('_agent', '').title()
 
-                try:
-                    result = future.result()
-                    agent_results[agent_name] = result
-
-                    score = result.get('score')
-                    if score is None:
-                        score = 50
-                        result['score'] = 50
+            try:
+                result = future.result()
+                agent_results[agent_name] = result
+
+                score = result.get('score')
+                if score is None:
+                    score = 50
+                    result['score'] = 50
+                if agent_cache_keys.get(agent_name):
+                    self._agent_cache.set(agent_cache_keys[agent_name], copy.deepcopy(result))
+                if logger.isEnabledFor(logging.INFO):
                     logger.info(f"{agent_name}: {score:.1f} - {result['rationale']}")
 
-                    if 'sentiment' in agent_name.lower():
-                        num_articles = result.get('details', {}).get('num_articles', 0)
-                        completion_msg = f"{agent_label} Agent: {num_articles} articles analyzed, score {score:.0f}/100"
-                    else:
-                        completion_msg = f"{agent_label} Agent complete: {score:.0f}/100"
-                except Exception as e:
-                    logger.error(f"Error in {agent_name} for {ticker}: {e}")
-                    agent_results[agent_name] = {
-                        'score': 50,
-                        'rationale': f'Analysis failed: {str(e)}',
-                        'details': {}
-                    }
-                    completion_msg = f"{agent_label} Agent: analysis failed"
-
-                # Record per-agent timing
-                _step_timings[agent_name] = round(agent_elapsed, 3)
-
-                # Progress from 42% to 98% based on completion count
-                pct = PHASE_AGENTS[0] + (completed_count / total_agents) * (PHASE_AGENTS[1] - PHASE_AGENTS[0])
-                update_progress(completion_msg, int(pct))
+                if agent_name == 'sentiment_agent':
+                    num_articles = result.get('details', {}).get('num_articles', 0)
+                    completion_msg = f"{agent_label} Agent: {num_articles} articles analyzed, score {score:.0f}/100"
+                else:
+                    completion_msg = f"{agent_label} Agent complete: {score:.0f}/100"
+            except Exception as e:
+                logger.error(f"Error in {agent_name} for {ticker}: {e}")
+                agent_results[agent_name] = {
+                    'score': 50,
+                    'rationale': f'Analysis failed: {str(e)}',
+                    'details': {}
+                }
+                completion_msg = f"{agent_label} Agent: analysis failed"
+                agents_failed = True
+
+            # Record per-agent timing
+            _step_timings[agent_name] = round(agent_elapsed, 3)
+
+            # Progress from 42% to 98% based on completion count
+            pct = PHASE_AGENTS[0] + (completed_count / total_agents) * (PHASE_AGENTS[1] - PHASE_AGENTS[0])
+            update_progress(completion_msg, int(pct))
         
         # 3. Phase 3: Blend scores and finalize (98-100%)
         blend_start = time.time()
         update_progress(f"Blending agent scores with configured weights...", 98)
+        # Custom agent weights (if provided) only apply for this blend
         blended_score = self._blend_scores(
             agent_results,
             regime_modulation=regime_modulation,
             regime_sensitivity=regime_sensitivity,
+            weights=self._resolve_weights(agent_weights),
         )
 
         recommendation = self._generate_recommendation(blended_score)
@@ -441,15 +825,15 @@ class PortfolioOrchestrator:
 
         update_progress(f"Analysis complete: {final_score:.1f}/100 ({total_time:.0f}s total)", 100)
 
-        # Restore original weights if they were changed
-        if agent_weights:
-            self.agent_weights = original_weights
-
-        # Extract agent scores and rationales for backward compatibility
-        agent_scores = {agent_name: (result.get('score') or 50) for agent_name, result in agent_results.items()}
-        agent_rationales = {agent_name: result.get('rationale', 'Analysis not available') for agent_name, result in agent_results.items()}
+        # Extract agent scores and rationales for backward compatibility (single pass)
+        agent_scores = {}
+        agent_rationales = {}
+        for agent_name, result in agent_results.items():
+            # Scores were normalized (None -> 50) in the agent phase; a real 0 stays 0
+            agent_scores[agent_name] = result.get('score', 50)
+            agent_rationales[agent_name] = result.get('rationale', 'Analysis not available')
 
-        return {
+        analysis = {
             'ticker': ticker,
             'analysis_date': analysis_date,
             'agent_results': agent_results,
@@ -458,14 +842,18 @@ class PortfolioOrchestrator:
             'blended_score': blended_score,
             'final_score': final_score,
             'eligible': True,
-            'recommendation': self._generate_recommendation(final_score),
-            'rationale': self._generate_comprehensive_rationale_simple(ticker, agent_results, final_score, data),
-            'fundamentals': data.get('fundamentals', {}),
+            'recommendation': recommendation,
+            'rationale': self._generate_comprehensive_rationale_simple(ticker, agent_scores, agent_rationales, final_score, data),
+            'fundamentals': fundamentals,
             'price_history': data.get('price_history', {}),
             'step_timings': _step_timings,
             'detected_regime': agent_results.get('macro_regime_agent', {}).get('regime', 'unknown') if regime_modulation else None,
-            'regime_adjusted_weights': getattr(self, '_last_regime_adjusted_weights', None),
+            'regime_adjusted_weights': getattr(self._local, 'last_regime_adjusted_weights', None),
         }
+        # A fallback score from a failed agent must not be pinned on disk
+        if not agents_failed:
+            self._save_analysis_cache(cache_file, analysis)
+        return analysis
     
     def analyze_stock(
         self,
@@ -524,31 +912,10 @@ class PortfolioOrchestrator:
             return ""
 
         lp = PortfolioOrchestrator._learned_phases
-        # Phase definitions: (start_pct, end_pct, learned_duration_seconds)
-        phases = [
-            (0,  42, lp['data_gather']),   # Data gathering
-            (42, 98, lp['agents']),         # Agent analysis (parallel)
-            (98, 100, lp['blend']),         # Finalization
-        ]
-
-        # Find current phase and calculate remaining time
-        remaining = 0.0
-        found_current = False
-
-        for start_pct, end_pct, duration in phases:
-            if not found_current:
-                if progress_pct < end_pct:
-                    # We're in this phase
-                    found_current = True
-                    phase_progress = (progress_pct - start_pct) / (end_pct - start_pct) if end_pct > start_pct else 1.0
-                    phase_progress = max(0.0, min(1.0, phase_progress))
-                    remaining += duration * (1.0 - phase_progress)
-                # else: we've passed this phase, skip it
-            else:
-                # Future phase - add full duration
-                remaining += duration
-
-        if not found_current:
+        # Progress arrives in a small set of discrete percentages, so the
+        # phase walk is memoized per (pct, learned durations)
+        remaining = _phase_remaining(progress_pct, (lp['data_gather'], lp['agents'], lp['blend']))
+        if remaining is None:
             return ""
 
         # EMA smoothing to prevent display jumps
@@ -566,18 +933,12 @@ class PortfolioOrchestrator:
         if remaining <= 0:
             return ""
 
-        # Format
-        secs = max(1, int(remaining))
-        if secs < 60:
-            return f" ~{secs}s"
-        else:
-            mins = secs // 60
-            s = secs % 60
-            return f" ~{mins}m {s}s"
+        return _format_eta(max(1, int(remaining)))
 
     def _blend_scores(self, agent_results: Dict[str, Dict],
                       regime_modulation: bool = False,
-                      regime_sensitivity: str = "moderate") -> float:
+                      regime_sensitivity: str = "moderate",
+                      weights: Dict[str, float] = None) -> float:
         """
         Blend agent scores using configured weights.
 
@@ -585,21 +946,27 @@ class PortfolioOrchestrator:
         on the macro regime detected by the macro_regime_agent.  The upside
         multiplier is skipped in that mode because the theory-based weights
         already encode factor-exposure philosophy.
+
+        weights defaults to self.agent_weights; pass per-call weights instead of
+        mutating the instance so concurrent analyses can blend independently.
         """
-        # Determine effective weights
-        effective_weights = dict(self.agent_weights)
+        if weights is None:
+            weights = self.agent_weights
 
+        # Determine effective weights
         if regime_modulation:
             regime = (agent_results.get('macro_regime_agent') or {}).get('regime', 'expansion')
             effective_weights = self._apply_regime_modulation(
-                effective_weights, regime, regime_sensitivity
+                weights, regime, regime_sensitivity
             )
-            # Stash for the caller to include in the result dict
-            self._last_regime_adjusted_weights = {
+            # Stash for the caller (same thread) to include in the result dict
+            self._local.last_regime_adjusted_weights = {
                 k: round(v, 4) for k, v in effective_weights.items()
             }
+            weight_items = effective_weights.items()
         else:
-            self._last_regime_adjusted_weights = None
+            self._local.last_regime_adjusted_weights = None
+            weight_items = self._weight_items if weights is self.agent_weights else weights.items()
 
         # Calculate base weighted score
         # Exclude agents that flagged data_unavailable (e.g. sentiment with
@@ -608,16 +975,19 @@ class PortfolioOrchestrator:
         total_score = 0
         total_weight = 0
 
-        for agent_name, weight in effective_weights.items():
+        for agent_name, weight in weight_items:
             if agent_name in agent_results:
                 result = agent_results[agent_name]
                 if result.get('data_unavailable'):
                     logger.info(
-                        f"Excluding {agent_name} from blend — data unavailable, "
-                        f"redistributing {weight:.0%} weight to remaining agents"
+                        "Excluding %s from blend — data unavailable, "
+                        "redistributing %.0f%% weight to remaining agents",
+                        agent_name, weight * 100
                     )
                     continue
-                score = result.get('score') or 50
+                score = result.get('score')
+                if score is None:
+                    score = 50
                 total_score += score * weight
                 total_weight += weight
 
@@ -625,7 +995,7 @@ class PortfolioOrchestrator:
 
         # ---- When regime modulation is active, return pure weighted average ----
         if regime_modulation:
-            logger.info(f"THEORY-BASED BLEND (regime modulation ON): {base_score:.1f}")
+            logger.info("THEORY-BASED BLEND (regime modulation ON): %.1f", base_score)
             return base_score
 
         # ========== UPSIDE POTENTIAL MULTIPLIER (non-theory-based presets only) ==========
@@ -633,58 +1003,54 @@ class PortfolioOrchestrator:
 
         upside_multiplier = 1.0  # Start at neutral
         upside_factors = []
+        # Factor descriptions are only for the log below; skip building them when INFO is off
+        log_factors = logger.isEnabledFor(logging.INFO)
 
-        # Factor 1: Growth/Momentum score
-        if 'growth_momentum_agent' in agent_results:
-            growth_score = agent_results['growth_momentum_agent'].get('score', 50)
-            if growth_score >= 75:
-                upside_multiplier += 0.08
-                upside_factors.append(f"Strong growth ({growth_score:.0f}/100) \u2192 +8% boost")
-            elif growth_score >= 60:
-                upside_multiplier += 0.04
-                upside_factors.append(f"Good growth ({growth_score:.0f}/100) \u2192 +4% boost")
-            elif growth_score < 30:
-                upside_multiplier -= 0.06
-                upside_factors.append(f"Weak growth ({growth_score:.0f}/100) \u2192 -6% penalty")
-
-        # Factor 2: Sentiment
-        if 'sentiment_agent' in agent_results:
-            sentiment_score = agent_results['sentiment_agent'].get('score') or 50
-            if sentiment_score >= 70:
-                upside_multiplier += 0.05
-                upside_factors.append(f"Positive sentiment ({sentiment_score:.0f}/100) \u2192 +5% boost")
-
-        # Factor 3: Value (good value = more runway)
-        if 'value_agent' in agent_results:
-            value_score = agent_results['value_agent'].get('score', 50)
-            if value_score >= 70:
-                upside_multiplier += 0.04
-                upside_factors.append(f"Attractive valuation ({value_score:.0f}/100) \u2192 +4% boost")
-
-        # Factor 4: Penalize extreme risk
-        if 'risk_agent' in agent_results:
-            risk_score = agent_results['risk_agent'].get('score', 50)
-            if risk_score < 25:
-                upside_multiplier -= 0.08
-                upside_factors.append(f"Extreme risk ({risk_score:.0f}/100) \u2192 -8% penalty")
+        # First matching tier per agent applies (growth, sentiment, value, risk)
+        for agent_name, tiers in self._UPSIDE_TIERS:
+            if agent_name not in agent_results:
+                continue
+            score = agent_results[agent_name].get('score')
+            if score is None:
+                score = 50
+            for at_least, threshold, delta, label in tiers:
+                if (score >= threshold) if at_least else (score < threshold):
+                    upside_multiplier += delta
+                    if log_factors:
+                        upside_factors.append(
+                            f"{label} ({score:.0f}/100) \u2192 {delta:+.0%} {'boost' if delta > 0 else 'penalty'}"
+                        )
+                    break
 
         # Tighter cap: +/-15% max swing
-        upside_multiplier = min(upside_multiplier, 1.15)
-        upside_multiplier = max(upside_multiplier, 0.85)
+        upside_multiplier = 0.85 if upside_multiplier < 0.85 else 1.15 if upside_multiplier > 1.15 else upside_multiplier
 
         final_score = base_score * upside_multiplier
 
         # Log the upside calculation for transparency
         if upside_factors:
-            logger.info(f"UPSIDE MULTIPLIER APPLIED: {upside_multiplier:.2f}x")
-            logger.info(f"   Base Score: {base_score:.1f}")
-            logger.info(f"   Upside Factors:")
+            logger.info("UPSIDE MULTIPLIER APPLIED: %.2fx", upside_multiplier)
+            logger.info("   Base Score: %.1f", base_score)
+            logger.info("   Upside Factors:")
             for factor in upside_factors:
-                logger.info(f"     - {factor}")
-            logger.info(f"   Final Score: {final_score:.1f} (boosted by {((upside_multiplier - 1) * 100):.0f}%)")
+                logger.info("     - %s", factor)
+            logger.info("   Final Score: %.1f (boosted by %.0f%%)", final_score, (upside_multiplier - 1) * 100)
 
         return final_score
 
+    # Upside multiplier staircase: (agent, ((at_least, threshold, delta, label), ...)).
+    # at_least=True matches score >= threshold, False matches score < threshold.
+    _UPSIDE_TIERS = (
+        ('growth_momentum_agent', (
+            (True, 75, +0.08, "Strong growth"),
+            (True, 60, +0.04, "Good growth"),
+            (False, 30, -0.06, "Weak growth"),
+        )),
+        ('sentiment_agent', ((True, 70, +0.05, "Positive sentiment"),)),
+        ('value_agent', ((True, 70, +0.04, "Attractive valuation"),)),
+        ('risk_agent', ((False, 25, -0.08, "Extreme risk"),)),
+    )
+
     # --- Regime-based weight modulation (Theory Based preset) ---
     # Shift table grounded in regime-switching research (Ang & Bekaert, 2002)
     _REGIME_SHIFTS = {
@@ -753,11 +1119,13 @@ class PortfolioOrchestrator:
                 break
             adjusted = {k: max(v, 0.02) for k, v in adjusted.items()}
 
-        logger.info(
-            f"REGIME MODULATION: regime={regime}, sensitivity={sensitivity} "
-            f"| base={{{', '.join(f'{k}: {v:.2f}' for k, v in base_weights.items())}}} "
-            f"| adjusted={{{', '.join(f'{k}: {v:.3f}' for k, v in adjusted.items())}}}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "REGIME MODULATION: regime=%s, sensitivity=%s | base={%s} | adjusted={%s}",
+                regime, sensitivity,
+                ', '.join(f'{k}: {v:.2f}' for k, v in base_weights.items()),
+                ', '.join(f'{k}: {v:.3f}' for k, v in adjusted.items()),
+            )
 
         return adjusted
 
@@ -774,99 +1142,82 @@ class PortfolioOrchestrator:
         else:
             return "SELL"
     
-    def _generate_comprehensive_rationale_simple(self, ticker: str, agent_results: Dict, final_score: float, data: Dict) -> str:
-        """Generate comprehensive investment rationale."""
+    @staticmethod
+    def _format_market_cap(market_cap, decimals: int = 1) -> str:
+        """Format a market cap as $X.XT / $X.XB / $X.XM, or 'N/A' if not numeric."""
+        if not isinstance(market_cap, (int, float)) or market_cap <= 0:
+            return "N/A"
+        if market_cap >= 1e12:
+            return f"${market_cap/1e12:.{decimals}f}T"
+        if market_cap >= 1e9:
+            return f"${market_cap/1e9:.{decimals}f}B"
+        if market_cap >= 1e6:
+            return f"${market_cap/1e6:.{decimals}f}M"
+        return f"${market_cap:,.0f}"
+
+    def _generate_comprehensive_rationale_simple(self, ticker: str, agent_scores: Dict[str, float],
+                                                 agent_rationales: Dict[str, str], final_score: float,
+                                                 data: Dict) -> str:
+        """Generate comprehensive investment rationale from pre-extracted agent scores/rationales."""
         fundamentals = data.get('fundamentals', {})
-        rationale_parts = []
-
-        rationale_parts.append("=" * 80)
-        rationale_parts.append(f"COMPREHENSIVE INVESTMENT ANALYSIS: {ticker}")
-        rationale_parts.append("=" * 80)
-
-        company_name = fundamentals.get('name', ticker)
-        sector = fundamentals.get('sector', 'Unknown')
-        rationale_parts.append(f"\nCOMPANY OVERVIEW:")
-        rationale_parts.append(f"Company: {company_name}")
-        rationale_parts.append(f"Sector: {sector}")
-
-        rationale_parts.append(f"\nKEY FINANCIAL METRICS:")
-        price = fundamentals.get('price')
-        if price:
-            rationale_parts.append(f"Current Price: ${price:.2f}")
-        market_cap = fundamentals.get('market_cap')
-        if market_cap:
-            if market_cap >= 1e12:
-                rationale_parts.append(f"Market Cap: ${market_cap/1e12:.2f}T")
-            elif market_cap >= 1e9:
-                rationale_parts.append(f"Market Cap: ${market_cap/1e9:.2f}B")
-            else:
-                rationale_parts.append(f"Market Cap: ${market_cap/1e6:.2f}M")
-        pe_ratio = fundamentals.get('pe_ratio')
-        if pe_ratio:
-            rationale_parts.append(f"P/E Ratio: {pe_ratio:.2f}")
-        beta = fundamentals.get('beta')
-        if beta:
-            rationale_parts.append(f"Beta: {beta:.2f}")
-        dividend_yield = fundamentals.get('dividend_yield')
-        if dividend_yield:
-            rationale_parts.append(f"Dividend Yield: {dividend_yield*100:.2f}%")
-
-        rationale_parts.append(f"\nMULTI-AGENT ANALYSIS:")
-        rationale_parts.append("=" * 80)
-        agent_order = ['value_agent', 'growth_momentum_agent', 'macro_regime_agent', 'risk_agent', 'sentiment_agent']
-        agent_labels = {
-            'value_agent': 'VALUE ANALYSIS',
-            'growth_momentum_agent': 'GROWTH ANALYSIS',
-            'macro_regime_agent': 'MACROECONOMIC ANALYSIS',
-            'risk_agent': 'RISK ASSESSMENT',
-            'sentiment_agent': 'MARKET SENTIMENT ANALYSIS'
-        }
-        for agent_name in agent_order:
-            if agent_name in agent_results:
-                result = agent_results[agent_name]
-                score = result.get('score') or 50
-                rationale = result.get('rationale', 'Analysis not available')
-                rationale_parts.append(f"\n{agent_labels.get(agent_name, agent_name.upper())}:")
-                rationale_parts.append(f"Score: {score:.2f}/100")
-                rationale_parts.append(f"{rationale}")
-                rationale_parts.append("-" * 80)
 
-        rationale_parts.append(f"\nFINAL RECOMMENDATION:")
-        rationale_parts.append(f"Final Score: {final_score:.2f}/100")
-        rationale_parts.append("=" * 80)
+        rationale_parts = [
+            _SEP_EQ,
+            f"COMPREHENSIVE INVESTMENT ANALYSIS: {ticker}",
+            _SEP_EQ,
+            "\nCOMPANY OVERVIEW:",
+            f"Company: {fundamentals.get('name', ticker)}",
+            f"Sector: {fundamentals.get('sector', 'Unknown')}",
+            "\nKEY FINANCIAL METRICS:",
+        ]
+        for label, key, fmt in _RATIONALE_METRICS:
+            value = fundamentals.get(key)
+            if value:
+                rationale_parts.append(f"{label}: {fmt(value)}")
+
+        rationale_parts.extend(("\nMULTI-AGENT ANALYSIS:", _SEP_EQ))
+        for agent_name, label in _RATIONALE_SECTIONS:
+            score = agent_scores.get(agent_name)
+            if score is not None:
+                rationale_parts.extend((
+                    f"\n{label}:",
+                    f"Score: {score:.2f}/100",
+                    str(agent_rationales[agent_name]),
+                    _SEP_DASH,
+                ))
+
+        rationale_parts.extend((
+            "\nFINAL RECOMMENDATION:",
+            f"Final Score: {final_score:.2f}/100",
+            _SEP_EQ,
+        ))
 
         return '\n'.join(rationale_parts)
 
     def _check_ips_eligibility(self, ticker: str, fundamentals: dict, blended_score: float) -> bool:
-        """Check if a stock meets basic IPS eligibility constraints."""
-        ips = self.ips_config
+        """Check if a stock meets basic IPS eligibility constraints.
+
+        Scalar threshold checks run first; the sector string check runs last.
+        """
+        # Check minimum market cap
+        market_cap = fundamentals.get('market_cap', 0)
+        if market_cap and market_cap < self._min_market_cap:
+            return False
 
         # Check minimum price
         price = fundamentals.get('price', 0)
-        min_price = ips.get('universe', {}).get('min_price', 1.0)
-        if price and price < min_price:
+        if price and price < self._min_price:
             return False
 
-        # Check minimum market cap
-        market_cap = fundamentals.get('market_cap', 0)
-        min_market_cap = ips.get('universe', {}).get('min_market_cap', 0)
-        if market_cap and market_cap < min_market_cap:
+        # Check beta range
+        beta = fundamentals.get('beta')
+        if beta and (beta < self._beta_min or beta > self._beta_max):
             return False
 
         # Check excluded sectors
         sector = fundamentals.get('sector', '')
-        excluded_sectors = ips.get('exclusions', {}).get('sectors', [])
-        if sector and excluded_sectors:
-            if sector.lower() in [s.lower() for s in excluded_sectors]:
-                return False
-
-        # Check beta range
-        beta = fundamentals.get('beta')
-        if beta:
-            beta_min = ips.get('portfolio_constraints', {}).get('beta_min', 0)
-            beta_max = ips.get('portfolio_constraints', {}).get('beta_max', 999)
-            if beta < beta_min or beta > beta_max:
-                return False
+        if sector and self._excluded_sectors and sector.lower() in self._excluded_sectors:
+            return False
 
         return True
     
@@ -879,16 +1230,8 @@ class PortfolioOrchestrator:
         step_timings=None
     ) -> Dict[str, Any]:
         """Gather all necessary data for analysis using parallel API calls for speed."""
-        # Calculate date range (1 year lookback) - ensure no future dates
-        end_date = analysis_date
-        start_date = pd.to_datetime(analysis_date) - pd.DateOffset(years=1)
-        start_date = start_date.strftime('%Y-%m-%d')
-
-        # Ensure we don't use future dates that break API calls
-        today = datetime.now().date()
-        if pd.to_datetime(end_date).date() > today:
-            end_date = today.strftime('%Y-%m-%d')
-            start_date = (pd.to_datetime(today) - pd.DateOffset(years=1)).strftime('%Y-%m-%d')
+        # Calculate date range (1 year lookback) - shared by every ticker on the same date
+        start_date, end_date = _resolve_date_range(str(analysis_date)[:10], date.today())
 
         data = {
             'ticker': ticker,
@@ -900,104 +1243,116 @@ class PortfolioOrchestrator:
         if progress_callback:
             progress_callback(f"Querying Polygon, Alpha Vantage, Perplexity for {ticker} fundamentals...")
 
-        # PARALLEL DATA GATHERING - Run all 3 API calls simultaneously
-        _data_start_times = {}
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {}
-
-            # Task 1: Get fundamentals (API calls - slowest, ~30-40s)
-            _data_start_times['fundamentals'] = time.time()
-            if hasattr(self.data_provider, 'get_fundamentals_enhanced'):
-                futures['fundamentals'] = executor.submit(
-                    self.data_provider.get_fundamentals_enhanced, ticker
-                )
-            else:
-                futures['fundamentals'] = executor.submit(
-                    self.data_provider.get_fundamentals, ticker
-                )
+        # PARALLEL DATA GATHERING - API calls run on the shared I/O pool
+        starts = SimpleNamespace(fundamentals=0.0, price_history=0.0)
+        executor = self._io_pool
+        futures = {}
+
+        # Task 1: Get fundamentals (API calls - slowest, ~30-40s)
+        starts.fundamentals = time.time()
+        if hasattr(self.data_provider, 'get_fundamentals_enhanced'):
+            cache_kwargs = {'cache_hours': self._fundamentals_cache_hours} if self._fundamentals_cache_hours > 0 else {}
+            futures['fundamentals'] = executor.submit(
+                self._guarded, self.data_provider.get_fundamentals_enhanced, ticker, **cache_kwargs
+            )
+        else:
+            futures['fundamentals'] = executor.submit(
+                self._guarded, self.data_provider.get_fundamentals, ticker
+            )
 
-            # Task 2: Get price history (Polygon/Alpha Vantage API - medium, ~3-5s)
-            _data_start_times['price_history'] = time.time()
+        # Task 2: Get price history (Polygon/Alpha Vantage API - medium, ~3-5s)
+        # Enhanced fundamentals ('comprehensive_enhanced') already carry what the
+        # price history is synthesized from, so the API result would be discarded
+        # below - don't spend the request/quota on it.
+        history_from_fundamentals = hasattr(self.data_provider, 'get_fundamentals_enhanced')
+        if not history_from_fundamentals:
+            starts.price_history = time.time()
             if hasattr(self.data_provider, 'get_price_history_enhanced'):
                 futures['price_history'] = executor.submit(
-                    self.data_provider.get_price_history_enhanced,
+                    self._guarded, self.data_provider.get_price_history_enhanced,
                     ticker, start_date, end_date
                 )
             else:
                 futures['price_history'] = executor.submit(
-                    self.data_provider.get_price_history,
+                    self._guarded, self.data_provider.get_price_history,
                     ticker, start_date, end_date
                 )
 
-            # Task 3: Generate benchmark data (synthetic - fast, <1s)
-            _data_start_times['benchmark'] = time.time()
-            futures['benchmark'] = executor.submit(
-                self._create_benchmark_data, benchmark, start_date, end_date
-            )
-
-            task_labels = {
-                'fundamentals': 'Fundamentals (P/E, EPS, market cap, financials)',
-                'price_history': 'Price history (1 year daily prices)',
-                'benchmark': 'Benchmark data (S&P 500 comparison)'
-            }
-            completed_tasks = []
+        task_labels = {
+            'fundamentals': 'Fundamentals (P/E, EPS, market cap, financials)',
+            'price_history': 'Price history (1 year daily prices)',
+            'benchmark': 'Benchmark data (S&P 500 comparison)'
+        }
+        completed_tasks = []
 
-            # Collect results using as_completed for real parallel processing
-            future_to_name = {v: k for k, v in futures.items()}
-            for future in as_completed(futures.values()):
-                name = future_to_name[future]
-                task_elapsed = time.time() - _data_start_times[name]
-                try:
-                    result = future.result()
-                    if name == 'fundamentals':
-                        data['fundamentals'] = result
-                        if result:
-                            logger.info(f"ORCHESTRATOR RECEIVED FUNDAMENTALS FOR {ticker}:")
-                            logger.info(f"   price: {result.get('price')} pe_ratio: {result.get('pe_ratio')} beta: {result.get('beta')}")
-                            logger.info(f"   data_sources: {result.get('data_sources')}")
-                    elif name == 'price_history':
-                        data['_price_history_raw'] = result
-                    elif name == 'benchmark':
-                        data['benchmark_history'] = result
-                    logger.info(f"Data task '{name}' completed for {ticker} in {task_elapsed:.1f}s")
-                    completed_tasks.append(name)
-
-                    # Record per-data-task timing
-                    if step_timings is not None:
-                        step_timings[name] = round(task_elapsed, 3)
-
-                    if progress_callback:
-                        remaining = [task_labels[n] for n in futures if n not in completed_tasks]
-                        if remaining:
-                            progress_callback(f"Received {task_labels[name]} ({task_elapsed:.0f}s). Waiting: {remaining[0]}...")
-                        else:
-                            progress_callback(f"All data received for {ticker}. Processing...")
-                except Exception as e:
-                    logger.error(f"Failed to get {name} for {ticker}: {e}")
-                    completed_tasks.append(name)
-                    if step_timings is not None:
-                        step_timings[name] = round(task_elapsed, 3)
-                    if name == 'fundamentals':
-                        data['fundamentals'] = {}
-                    elif name == 'price_history':
-                        data['_price_history_raw'] = None
-                    elif name == 'benchmark':
-                        data['benchmark_history'] = pd.DataFrame()
+        # Task 3: Generate benchmark data (synthetic + memoized - fast, <1s).
+        # Built on this thread while the API requests above are in flight;
+        # it doesn't need a pool worker.
+        benchmark_start = time.time()
+        try:
+            data['benchmark_history'] = self._create_benchmark_data(benchmark, start_date, end_date)
+        except Exception as e:
+            logger.error(f"Failed to get benchmark for {ticker}: {e}")
+            data['benchmark_history'] = pd.DataFrame()
+        benchmark_elapsed = time.time() - benchmark_start
+        completed_tasks.append('benchmark')
+        if step_timings is not None:
+            step_timings['benchmark'] = round(benchmark_elapsed, 3)
+        if progress_callback:
+            progress_callback(f"Received {task_labels['benchmark']} ({benchmark_elapsed:.0f}s). "
+                              f"Waiting: {task_labels['fundamentals']}...")
+
+        # Collect results using as_completed for real parallel processing
+        future_to_name = {v: k for k, v in futures.items()}
+        for future in as_completed(futures.values()):
+            name = future_to_name[future]
+            task_elapsed = time.time() - getattr(starts, name)
+            try:
+                result = future.result()
+                if name == 'fundamentals':
+                    data['fundamentals'] = result
+                    if result and logger.isEnabledFor(logging.INFO):
+                        price, pe_ratio, beta = result.get('price'), result.get('pe_ratio'), result.get('beta')
+                        logger.info(f"ORCHESTRATOR RECEIVED FUNDAMENTALS FOR {ticker}:")
+                        logger.info(f"   price: {price} pe_ratio: {pe_ratio} beta: {beta}")
+                        logger.info(f"   data_sources: {result.get('data_sources')}")
+                elif name == 'price_history':
+                    data['_price_history_raw'] = result
+                logger.info(f"Data task '{name}' completed for {ticker} in {task_elapsed:.1f}s")
+                completed_tasks.append(name)
+
+                # Record per-data-task timing
+                if step_timings is not None:
+                    step_timings[name] = round(task_elapsed, 3)
+
+                if progress_callback:
+                    remaining = [task_labels[n] for n in futures if n not in completed_tasks]
+                    if remaining:
+                        progress_callback(f"Received {task_labels[name]} ({task_elapsed:.0f}s). Waiting: {remaining[0]}...")
+                    else:
+                        progress_callback(f"All data received for {ticker}. Processing...")
+            except Exception as e:
+                logger.error(f"Failed to get {name} for {ticker}: {e}")
+                completed_tasks.append(name)
+                if step_timings is not None:
+                    step_timings[name] = round(task_elapsed, 3)
+                if name == 'fundamentals':
+                    data['fundamentals'] = {}
+                elif name == 'price_history':
+                    data['_price_history_raw'] = None
 
         # Process price history (may depend on fundamentals result)
-        if data.get('fundamentals', {}).get('source') == 'comprehensive_enhanced':
-            data['price_history'] = self._extract_price_history_from_fundamentals(data['fundamentals'])
+        fnd = data.get('fundamentals') or {}
+        if fnd.get('source') == 'comprehensive_enhanced':
+            data['price_history'] = self._extract_price_history_from_fundamentals(fnd)
         elif data.get('_price_history_raw') is not None:
             data['price_history'] = data['_price_history_raw']
-        elif data.get('fundamentals'):
-            data['price_history'] = self._extract_price_history_from_fundamentals(data['fundamentals'])
+        elif fnd:
+            data['price_history'] = self._extract_price_history_from_fundamentals(fnd)
         else:
             data['price_history'] = pd.DataFrame()
         data.pop('_price_history_raw', None)
 
-        if 'benchmark_history' not in data:
-            data['benchmark_history'] = pd.DataFrame()
-
         # Add existing portfolio for risk analysis
         data['existing_portfolio'] = existing_portfolio or []
 
@@ -1012,61 +1367,86 @@ class PortfolioOrchestrator:
         week_52_low = fundamentals.get('week_52_low', current_price * 0.8)
         
         # Create synthetic daily data for the past year
-        dates = pd.date_range(end=pd.Timestamp.now(), periods=252, freq='D')
+        dates = _synthetic_date_index(date.today(), 252)
         
         # Generate synthetic price movement between 52-week range
-        np.random.seed(42)  # For reproducible results
-        price_range = np.linspace(week_52_low, week_52_high, 252)
-        noise = np.random.normal(0, current_price * 0.02, 252)  # 2% daily volatility
-        synthetic_prices = price_range + noise
+        synthetic_prices = np.linspace(week_52_low, week_52_high, 252)
+        synthetic_prices += _SYNTH_NORM_NOISE * (current_price * 0.02)  # 2% daily volatility
         
         # Ensure current price is the last price
         synthetic_prices[-1] = current_price
         
-        # Create the DataFrame
-        df = pd.DataFrame({
-            'Date': dates,
+        # Returns column that the risk agent expects
+        returns = _simple_returns(synthetic_prices)
+        
+        # Create the DataFrame in one shot from the prepared arrays
+        return pd.DataFrame({
             'Close': synthetic_prices,
             'High': synthetic_prices * 1.01,
             'Low': synthetic_prices * 0.99,
-            'Volume': np.random.randint(1000000, 5000000, 252)
-        }).set_index('Date')
-        
-        # Add Returns column that the risk agent expects
-        df['Returns'] = df['Close'].pct_change()
-        
-        return df
+            'Volume': _SYNTH_VOLUME,
+            'Returns': returns
+        }, index=dates)
     
     def _create_benchmark_data(self, benchmark_ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
-        """Create synthetic benchmark data to avoid API issues."""
-        # Create simple synthetic S&P 500 data
-        dates = pd.date_range(start=start_date, end=end_date, freq='D')
-        
-        # Generate synthetic benchmark returns with realistic characteristics
-        np.random.seed(42)  # Reproducible
-        daily_returns = np.random.normal(0.0005, 0.01, len(dates))  # ~0.05% daily return, 1% volatility
-        
-        # Start at a reasonable level (e.g., 4000 for S&P 500)
-        start_price = 4000
-        prices = [start_price]
-        
-        for return_rate in daily_returns[1:]:
-            prices.append(prices[-1] * (1 + return_rate))
-        
-        # Create the DataFrame
-        df = pd.DataFrame({
-            'Date': dates,
-            'Close': prices,
-            'High': [p * 1.005 for p in prices],
-            'Low': [p * 0.995 for p in prices],
-            'Volume': np.random.randint(3000000000, 5000000000, len(dates))
-        }).set_index('Date')
-        
-        # Add Returns column that the risk agent expects
-        df['Returns'] = df['Close'].pct_change()
-        
-        return df
+        """Create synthetic benchmark data to avoid API issues.
+
+        The series only depends on (benchmark, start, end), so it is built once
+        per window and shared; callers get a shallow copy so adding columns
+        doesn't leak into the cached frame.
+        """
+        return _benchmark_df_cached(benchmark_ticker, start_date, end_date).copy(deep=False)
     
+    def analyze_many(
+        self,
+        tickers: List[str],
+        analysis_date: str,
+        max_workers: int = 8,
+        ips_prefilter: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze several tickers concurrently on one shared pool.
+
+        Tickers whose analysis raises are logged and left out.
+
+        Returns {ticker: analysis} in the order the tickers were given.
+        """
+        if not tickers:
+            return {}
+
+        # I/O-bound (API + LLM calls); upstream concurrency is further capped by _api_sema
+        analyses_by_ticker = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(len(tickers), max_workers)),
+                                thread_name_prefix='orch-ticker') as executor:
+            future_to_ticker = {
+                executor.submit(
+                    self.analyze_single_stock,
+                    ticker=ticker,
+                    analysis_date=analysis_date,
+                    existing_portfolio=[],
+                    ips_prefilter=ips_prefilter
+                ): ticker
+                for ticker in tickers
+            }
+
+            for i, future in enumerate(as_completed(future_to_ticker), 1):
+                ticker = future_to_ticker[future]
+                logger.info(f"   → Analyzed {i}/{len(tickers)}: {ticker}")
+
+                try:
+                    analysis = future.result()
+                except Exception as e:
+                    logger.error(f"   Analysis failed for {ticker}: {e}")
+                    continue
+
+                analyses_by_ticker[ticker] = analysis
+                if analysis.get('eligible'):
+                    logger.info(f"   {ticker}: Score {analysis['final_score']:.1f}")
+                else:
+                    logger.info(f"   {ticker}: not eligible ({analysis.get('error', 'unknown')})")
+
+        return {t: analyses_by_ticker[t] for t in tickers if t in analyses_by_ticker}
+
     def recommend_portfolio(
         self,
         challenge_context: str = None,
@@ -1138,36 +1518,25 @@ class PortfolioOrchestrator:
         # Stage 2: Run full analysis on each ticker
         logger.info(f"Running comprehensive analysis on {len(selected_tickers)} tickers...")
         
-        portfolio_analyses = []
-        for i, ticker in enumerate(selected_tickers, 1):
-            logger.info(f"   → Analyzing {i}/{len(selected_tickers)}: {ticker}")
-            
-            try:
-                analysis = self.analyze_single_stock(
-                    ticker=ticker,
-                    analysis_date=analysis_date,
-                    existing_portfolio=portfolio_analyses
-                )
-                
-                # Add AI rationale if available
-                if ticker in ticker_rationales:
-                    analysis['ai_rationale'] = ticker_rationales[ticker]
-                
-                portfolio_analyses.append(analysis)
-                logger.info(f"   {ticker}: Score {analysis['final_score']:.1f}")
-                
-            except Exception as e:
-                logger.error(f"   Analysis failed for {ticker}: {e}")
-                continue
-        
+        # Tickers are independent; existing_portfolio is left empty because holdings
+        # are not known until all analyses finish.
+        analyses_by_ticker = self.analyze_many(selected_tickers, analysis_date, ips_prefilter=True)
+        for ticker, analysis in analyses_by_ticker.items():
+            # Add AI rationale if available
+            if ticker in ticker_rationales:
+                analysis['ai_rationale'] = ticker_rationales[ticker]
+
+        # Selection order is preserved so score ties break deterministically
+        portfolio_analyses = list(analyses_by_ticker.values())
+
         # Stage 3: Filter and construct portfolio
         logger.info("Constructing portfolio from analyzed stocks...")
         
-        # Sort by final score
-        portfolio_analyses.sort(key=lambda x: x.get('final_score', 0), reverse=True)
-
-        # Take top N positions
-        portfolio_stocks = portfolio_analyses[:num_positions]
+        # Take top N eligible positions by final score (failed / IPS-ineligible analyses
+        # stay in all_analyses). nlargest is O(N log k) and keeps selection order on ties.
+        eligible_analyses = [a for a in portfolio_analyses if a.get('eligible')]
+        portfolio_stocks = heapq.nlargest(num_positions, eligible_analyses,
+                                          key=lambda x: x.get('final_score', 0))
         
         # Stage 4: Calculate position sizes (equal weight for now)
         equal_weight = 100.0 / len(portfolio_stocks) if portfolio_stocks else 0
@@ -1188,15 +1557,25 @@ class PortfolioOrchestrator:
             })
         
         # Stage 5: Calculate portfolio summary
-        total_weight = sum(p['target_weight_pct'] for p in portfolio)
-        avg_score = sum(p['final_score'] for p in portfolio) / len(portfolio) if portfolio else 0
-        
-        # Sector allocation
-        sector_exposure = {}
-        for p in portfolio:
-            sector = p['sector']
-            weight = p['target_weight_pct']
-            sector_exposure[sector] = sector_exposure.get(sector, 0) + weight
+        if portfolio:
+            agg_df = pd.DataFrame([
+                {'sector': p['sector'], 'weight': p['target_weight_pct'], 'score': p['final_score']}
+                for p in portfolio
+            ])
+            # Pull the columns out once as ndarrays
+            weights = agg_df['weight'].to_numpy(dtype=np.float64)
+            scores = agg_df['score'].to_numpy(dtype=np.float64)
+            total_weight = float(weights.sum())
+            avg_score = float(scores.mean())
+            # Sector allocation (first-seen order preserved)
+            sector_exposure = {
+                sector: float(weight)
+                for sector, weight in agg_df.groupby('sector', sort=False, dropna=False)['weight'].sum().items()
+            }
+        else:
+            total_weight = 0
+            avg_score = 0
+            sector_exposure = {}
         
         summary = {
             'num_positions': len(portfolio),
@@ -1215,7 +1594,7 @@ class PortfolioOrchestrator:
             'analysis_date': analysis_date,
             'all_candidates': all_candidates if tickers is None else selected_tickers,
             'selection_log': selection_log,
-            'eligible_count': len(portfolio_analyses),
+            'eligible_count': len(eligible_analyses),
             'total_analyzed': len(portfolio_analyses),
             'all_analyses': portfolio_analyses  # Include ALL analyzed stocks for QA archive
         }
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+On-disk response cache for the API test suite.
+Keeps repeated runs of the pipeline tests from re-spending paid API calls.
+
+TEST_CACHE_TTL   - max entry age in hours (default 24; 0 disables the cache)
+TEST_CACHE_BYPASS - set to 1 to ignore cached entries and refresh them
+"""
+import functools
+import hashlib
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+
+class FileCache:
+    """Pickle-per-key cache under .cache/<endpoint>/, aged by file mtime."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, ttl_hours: float = None):
+        self.cache_dir = Path(cache_dir)
+        if ttl_hours is None:
+            ttl_hours = float(os.getenv('TEST_CACHE_TTL', '24'))
+        self.ttl_seconds = ttl_hours * 3600
+        self.bypass = os.getenv('TEST_CACHE_BYPASS') == '1'
+
+    def _path(self, endpoint: str, key: str) -> Path:
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return self.cache_dir / endpoint / f"{digest}.pkl"
+
+    def get(self, endpoint: str, key: str):
+        """Return the cached payload, or None when missing, stale or bypassed."""
+        if self.bypass or self.ttl_seconds <= 0:
+            return None
+        path = self._path(endpoint, key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def set(self, endpoint: str, key: str, payload):
+        if self.ttl_seconds <= 0:
+            return
+        path = self._path(endpoint, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'wb') as f:
+                pickle.dump(payload, f)
+        except OSError:
+            pass
+
+
+_cache = FileCache()
+
+# Whether the calling thread's last cached_test call was served from disk
+_last_call = threading.local()
+
+
+def served_from_cache() -> bool:
+    """True if this thread's most recent cached_test call returned a cached payload."""
+    return getattr(_last_call, "hit", False)
+
+
+def cached_test(endpoint: str, key: str = ""):
+    """Memoize a fetch function's return value on disk for TEST_CACHE_TTL hours."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache_key = f"{key}|{args!r}|{sorted(kwargs.items())!r}"
+            payload = _cache.get(endpoint, cache_key)
+            _last_call.hit = payload is not None
+            if payload is None:
+                payload = fn(*args, **kwargs)
+                # Empty results usually mean every source failed; don't pin them
+                if payload:
+                    _cache.set(endpoint, cache_key, payload)
+            return payload
+        return wrapper
+    return decorator
@@ -0,0 +1,51 @@
+"""
+Retry helper for the API test suite.
+Retries transient failures (rate limits, 5xx, timeouts, dropped connections)
+with linear backoff plus jitter so one flaky response doesn't fail the run.
+"""
+import random
+import time
+
+import requests
+
+RETRY_STATUSES = (429, 500, 502, 503, 529)
+
+
+def _status_of(obj):
+    """HTTP status of a response or SDK exception (OpenAI: status_code, google-genai: code)."""
+    for attr in ('status_code', 'code'):
+        value = getattr(obj, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _is_transient(exc, on):
+    if isinstance(exc, (requests.Timeout, requests.ConnectionError)):
+        return True
+    if _status_of(exc) in on:
+        return True
+    # SDK timeout/connection errors (openai.APITimeoutError, APIConnectionError, ...)
+    name = type(exc).__name__
+    return 'Timeout' in name or 'Connection' in name
+
+
+def retry(fn, *, attempts=3, on=RETRY_STATUSES):
+    """
+    Call fn() until it succeeds, retrying transient failures.
+
+    A requests.Response whose status is in `on` counts as a failure; the last
+    response is returned as-is once attempts are exhausted so callers can
+    report its status. Non-transient exceptions propagate immediately.
+    """
+    for attempt in range(attempts):
+        last = attempt == attempts - 1
+        try:
+            result = fn()
+        except Exception as e:
+            if last or not _is_transient(e, on):
+                raise
+        else:
+            if last or not (isinstance(result, requests.Response) and result.status_code in on):
+                return result
+        time.sleep(random.uniform(2, 4) * (attempt + 1))
@@ -11,18 +11,94 @@ Key Improvements:
 - Dynamic time estimation based on actual performance
 """
 
+import hashlib
 import json
 import logging
+import os
+import re
+import threading
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Callable
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, is_dataclass
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson  # Optional: faster timing-history (de)serialization
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Stdlib fallback for values orjson handles natively: dataclasses as field dicts, else str()."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return obj.__dict__
+    return str(obj)
+
+
+def _json_dumps(obj: Any, pretty: bool = True) -> bytes:
+    """JSON bytes (orjson when installed); dataclasses serialize as objects, other non-JSON values via str()."""
+    if orjson:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if pretty else None)
+    return json.dumps(obj, indent=2 if pretty else None, default=_json_default).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Replace path with data via a sibling temp file, so readers never see a partial write."""
+    tmp_file = path.with_suffix(path.suffix + '.tmp')
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, path)
+
+
+@lru_cache(maxsize=64)
+def _present_columns(columns: Tuple[str, ...], candidates: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Candidate column names present in a sheet, in candidate priority order."""
+    present = set(columns)
+    return tuple(col for col in candidates if col in present)
+
+
+@lru_cache(maxsize=8)
+def _strip_table(chars: str) -> Dict[int, None]:
+    """str.translate table deleting the given characters."""
+    return str.maketrans('', '', chars)
+
+
+def _parse_numeric(series: pd.Series, strip_chars: str) -> pd.Series:
+    """Parse a sheet column to floats in one pass; blank/unparseable cells become NaN."""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float)
+    # One translate pass drops every formatting character (vs. one replace per char)
+    text = series.astype(str).str.strip().str.translate(_strip_table(strip_chars))
+    return pd.to_numeric(text, errors='coerce')
+
+
+def _smallest_k(keys: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k smallest keys, in stable-sort order (ties keep position
+    order). Selects with np.partition (O(N)) and only sorts the survivors.
+    """
+    if len(keys) <= k:
+        return np.argsort(keys, kind='stable')
+    kth = np.partition(keys, k - 1)[k - 1]
+    candidates = np.flatnonzero(keys <= kth)  # every tie at the cut-off, in position order
+    return candidates[np.argsort(keys[candidates], kind='stable')[:k]]
+
+
+def _shallow_asdict(obj) -> Dict[str, Any]:
+    """Field dict of a flat dataclass (no recursive deepcopy like dataclasses.asdict)."""
+    return obj.__dict__.copy()
+
+
 @dataclass
 class StockMovement:
     """Simple, focused data structure for stock movements."""
@@ -44,6 +120,61 @@ class StockMovement:
         return abs(self.price_change_pct)
 
 
+@dataclass
+class MovementBatch:
+    """
+    Columnar (struct-of-arrays) store of stock movements.
+    Counts and sorts run on the NumPy columns; indexing or iterating yields
+    StockMovement views for code that works per movement.
+    """
+    MAGNITUDES = ("significant", "major", "extreme")  # magnitude code -> label
+    
+    ticker: np.ndarray        # object
+    pct: np.ndarray           # float64 price change %
+    start_price: np.ndarray   # float64
+    end_price: np.ndarray     # float64
+    start_date: np.ndarray    # object (str)
+    magnitude: np.ndarray     # int8 code into MAGNITUDES
+    sector: np.ndarray        # object
+    end_date: str = ""
+    
+    @classmethod
+    def empty(cls, end_date: str = "") -> "MovementBatch":
+        obj = np.empty(0, dtype=object)
+        flt = np.empty(0, dtype=np.float64)
+        return cls(obj, flt, flt, flt, obj, np.empty(0, dtype=np.int8), obj, end_date)
+    
+    def __len__(self) -> int:
+        return len(self.pct)
+    
+    def __getitem__(self, i: int) -> StockMovement:
+        return StockMovement(
+            ticker=self.ticker[i],
+            price_change_pct=float(self.pct[i]),
+            start_price=float(self.start_price[i]),
+            end_price=float(self.end_price[i]),
+            start_date=self.start_date[i],
+            end_date=self.end_date,
+            magnitude=self.MAGNITUDES[self.magnitude[i]],
+            sector=self.sector[i]
+        )
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+    
+    def take(self, idx: np.ndarray) -> List[StockMovement]:
+        """StockMovement views for the given row indices, in order."""
+        return [self[i] for i in idx]
+    
+    @property
+    def up_count(self) -> int:
+        return int(np.count_nonzero(self.pct > 0))
+    
+    @property
+    def extreme_count(self) -> int:
+        return int(np.count_nonzero(self.magnitude == 2))
+
+
 @dataclass
 class MovementInsight:
     """Key insights about a stock movement."""
@@ -60,6 +191,18 @@ class DynamicTimeEstimator:
     Provides increasingly accurate estimates as the task progresses.
     """
     
+    HISTORY_FILE = Path("data/performance_analysis_v2/timing_history.json")
+    EMA_ALPHA = 0.3  # weight of the newest run in the timing averages
+    _history_lock = threading.Lock()  # shared: all estimators write the same file
+    PHASE_ORDER = ('identify_movements', 'analyze_movements', 'generate_recommendations', 'create_report')
+    # Phase -> historical_averages key ('analyze_per_movement' is per movement)
+    PHASE_AVERAGE_KEYS = {
+        'identify_movements': 'identify_movements',
+        'analyze_movements': 'analyze_per_movement',
+        'generate_recommendations': 'generate_recommendations',
+        'create_report': 'create_report'
+    }
+    
     def __init__(self):
         self.phase_times = {}  # Store actual times for each phase
         self.current_phase = None
@@ -80,38 +223,56 @@ class DynamicTimeEstimator:
     def _load_history(self):
         """Load historical timing data to improve initial estimates."""
         try:
-            history_file = Path("data/performance_analysis_v2/timing_history.json")
+            history_file = self.HISTORY_FILE
             if history_file.exists():
-                with open(history_file, 'r') as f:
-                    data = json.load(f)
-                    if 'averages' in data:
-                        self.historical_averages.update(data['averages'])
-                        logger.info(f"Loaded timing history: {self.historical_averages}")
+                data = _json_loads(history_file.read_bytes())
+                if 'averages' in data:
+                    self.historical_averages.update(data['averages'])
+                    logger.info(f"Loaded timing history: {self.historical_averages}")
         except Exception as e:
             logger.debug(f"Could not load timing history: {e}")
     
     def _save_history(self):
-        """Save timing data for future runs."""
+        """
+        Save timing data for future runs.
+        
+        The file is small, so it is written synchronously. The lock covers the
+        whole read-merge-write, so estimators finishing together each fold their
+        run into the latest averages on disk instead of overwriting one another.
+        """
+        if not self.phase_times:
+            return
         try:
-            history_file = Path("data/performance_analysis_v2/timing_history.json")
-            history_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Update averages with exponential moving average (70% old, 30% new)
-            if self.phase_times:
-                for phase, duration in self.phase_times.items():
-                    if phase in self.historical_averages:
-                        old = self.historical_averages[phase]
-                        self.historical_averages[phase] = old * 0.7 + duration * 0.3
-                    else:
-                        self.historical_averages[phase] = duration
+            history_file = self.HISTORY_FILE
+            with self._history_lock:
+                # Start from what other runs have saved since this estimator loaded
+                averages = self.historical_averages
+                if history_file.exists():
+                    try:
+                        averages.update(_json_loads(history_file.read_bytes()).get('averages', {}))
+                    except Exception as e:
+                        logger.debug(f"Could not reload timing history: {e}")
                 
-                with open(history_file, 'w') as f:
-                    json.dump({
-                        'averages': self.historical_averages,
-                        'last_updated': datetime.now().isoformat()
-                    }, f, indent=2)
+                # Update averages with exponential moving average (70% old, 30% new),
+                # as one vector op over every phase that already has an average
+                known = [phase for phase in self.phase_times if phase in averages]
+                if known:
+                    old = np.fromiter((averages[phase] for phase in known), dtype=np.float64, count=len(known))
+                    observed = np.fromiter((self.phase_times[phase] for phase in known), dtype=np.float64, count=len(known))
+                    averages.update(zip(known, (old * (1 - self.EMA_ALPHA) + observed * self.EMA_ALPHA).tolist()))
+                for phase, duration in self.phase_times.items():
+                    if phase not in averages:
+                        averages[phase] = duration
                 
-                logger.info(f"Saved timing history: {self.historical_averages}")
+                payload = {
+                    'averages': dict(averages),
+                    'last_updated': datetime.now().isoformat()
+                }
+                # Atomic replace (temp file + os.replace) so readers never see a partial file
+                history_file.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write_bytes(history_file, _json_dumps(payload))
+            
+            logger.info(f"Saved timing history: {payload['averages']}")
         except Exception as e:
             logger.debug(f"Could not save timing history: {e}")
     
@@ -149,63 +310,38 @@ class DynamicTimeEstimator:
         
         Returns: estimated seconds remaining
         """
-        elapsed_total = time.time() - self.total_start_time if self.total_start_time else 0
+        now = time.time()
+        elapsed_total = now - self.total_start_time if self.total_start_time else 0
+        averages = self.historical_averages
+        analyze_total = averages['analyze_per_movement'] * max(movement_count, 1)
         
         # Calculate time for remaining work in current phase
         if current_phase == 'analyze_movements' and movement_count > 0:
             # Use actual time per movement if we have data
-            if self.phase_start_time:
-                elapsed_in_phase = time.time() - self.phase_start_time
-                movements_processed = int(movement_count * progress_pct)
-                if movements_processed > 0:
-                    time_per_movement = elapsed_in_phase / movements_processed
-                    remaining_movements = movement_count - movements_processed
-                    phase_remaining = remaining_movements * time_per_movement
-                else:
-                    # Fallback to historical average
-                    phase_remaining = movement_count * self.historical_averages['analyze_per_movement']
+            movements_processed = int(movement_count * progress_pct) if self.phase_start_time else 0
+            if movements_processed > 0:
+                time_per_movement = (now - self.phase_start_time) / movements_processed
+                phase_remaining = (movement_count - movements_processed) * time_per_movement
             else:
-                phase_remaining = movement_count * self.historical_averages['analyze_per_movement']
-        else:
+                # Fallback to historical average
+                phase_remaining = movement_count * averages['analyze_per_movement']
+        elif current_phase in self.PHASE_AVERAGE_KEYS:
             # For other phases, estimate based on historical data
-            phase_key_map = {
-                'identify_movements': 'identify_movements',
-                'analyze_movements': 'analyze_per_movement',
-                'generate_recommendations': 'generate_recommendations',
-                'create_report': 'create_report'
-            }
-            
-            if current_phase in phase_key_map:
-                phase_key = phase_key_map[current_phase]
-                estimated_phase_time = self.historical_averages.get(phase_key, 1.0)
-                if phase_key == 'analyze_per_movement':
-                    estimated_phase_time *= max(movement_count, 1)
-                phase_remaining = estimated_phase_time * (1.0 - progress_pct)
-            else:
-                phase_remaining = 1.0 * (1.0 - progress_pct)
+            estimated_phase_time = averages.get(self.PHASE_AVERAGE_KEYS[current_phase], 1.0)
+            if current_phase == 'analyze_movements':
+                estimated_phase_time *= max(movement_count, 1)
+            phase_remaining = estimated_phase_time * (1.0 - progress_pct)
+        else:
+            phase_remaining = 1.0 * (1.0 - progress_pct)
         
         # Add time for remaining phases
-        phase_order = ['identify_movements', 'analyze_movements', 'generate_recommendations', 'create_report']
-        remaining_phases = []
-        
-        try:
-            current_idx = phase_order.index(current_phase)
-            remaining_phases = phase_order[current_idx + 1:]
-        except ValueError:
-            remaining_phases = []
-        
         remaining_phase_time = 0
-        for phase in remaining_phases:
-            if phase == 'analyze_movements':
-                remaining_phase_time += self.historical_averages['analyze_per_movement'] * max(movement_count, 1)
-            else:
-                phase_key_map_full = {
-                    'identify_movements': 'identify_movements',
-                    'generate_recommendations': 'generate_recommendations',
-                    'create_report': 'create_report'
-                }
-                if phase in phase_key_map_full:
-                    remaining_phase_time += self.historical_averages[phase_key_map_full[phase]]
+        if current_phase in self.PHASE_AVERAGE_KEYS:
+            for phase in self.PHASE_ORDER[self.PHASE_ORDER.index(current_phase) + 1:]:
+                if phase == 'analyze_movements':
+                    remaining_phase_time += analyze_total
+                else:
+                    remaining_phase_time += averages[phase]
         
         total_remaining = phase_remaining + remaining_phase_time
         
@@ -213,11 +349,11 @@ class DynamicTimeEstimator:
         if elapsed_total > 5:  # Only after we have some data
             # Compare actual time to what we would have estimated
             estimated_so_far = 0
-            for completed_phase, duration in self.phase_times.items():
+            for completed_phase in self.phase_times:
                 if completed_phase == 'identify_movements':
-                    estimated_so_far += self.historical_averages['identify_movements']
+                    estimated_so_far += averages['identify_movements']
                 elif 'analyze' in completed_phase:
-                    estimated_so_far += self.historical_averages['analyze_per_movement'] * max(movement_count, 1)
+                    estimated_so_far += analyze_total
             
             if estimated_so_far > 0:
                 adjustment_factor = elapsed_total / estimated_so_far
@@ -246,11 +382,57 @@ class PerformanceAnalysisEngineV2:
     4. SIMPLICITY - Easy to understand and maintain
     """
     
-    def __init__(self, data_provider, openai_client=None, perplexity_client=None):
-        """Initialize the engine with required components."""
+    # Report history retention (report_history.jsonl is trimmed once it passes the byte threshold)
+    REPORT_HISTORY_LIMIT = 50
+    REPORT_HISTORY_TRIM_BYTES = 2 * 1024 * 1024
+    # Fields that differ on every run; ignored when deciding whether a report changed
+    REPORT_VOLATILE_KEYS = frozenset({'report_id', 'generated_at'})
+    
+    # Minimum seconds between per-movement progress callbacks
+    PROGRESS_INTERVAL = 0.2
+    STATUS_TEMPLATE = "Analyzing {ticker} ({position}/{total}) - Stock {direction} {pct:.1f}% | {remaining} stocks remaining..."
+    
+    # Likely catalyst per magnitude code (MovementBatch.MAGNITUDES order):
+    # (catalyst_type, confidence, explanation, actionable)
+    INSIGHT_TABLE = (
+        # Significant moves are often technical or gradual accumulation
+        ("technical", 2, "technical momentum or gradual trend.",
+         "Consider momentum indicators and technical analysis in scoring."),
+        # Major moves could be analyst actions, sector trends, or business developments
+        ("analyst_or_sector", 3, "possible analyst upgrade/downgrade or sector momentum.",
+         "Monitor analyst ratings and sector trends more closely."),
+        # Extreme moves are usually earnings or major news
+        ("earnings_or_news", 4, "likely earnings report or major company news.",
+         "Increase sentiment agent weight to catch major news events earlier."),
+    )
+    
+    # Candidate sheet columns, in priority order
+    PCT_COLUMNS = ('Percent Change', 'Price Change %', '% Change', 'Percent_Change')
+    START_PRICE_COLUMNS = ('Price at Analysis', 'Price_at_Analysis')
+    END_PRICE_COLUMNS = ('Price', 'Current Price')
+    
+    # Recommendation sort rank (unknown priorities sort last)
+    PRIORITY_ORDER = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+    
+    def __init__(
+        self,
+        data_provider,
+        openai_client=None,
+        perplexity_client=None,
+        openai_client_factory: Optional[Callable[[], Any]] = None,
+        perplexity_client_factory: Optional[Callable[[], Any]] = None
+    ):
+        """
+        Initialize the engine with required components.
+        
+        LLM clients can be passed ready-made or as zero-argument factories that
+        are only called on first use; the fast heuristic path needs neither.
+        """
         self.data_provider = data_provider
-        self.openai_client = openai_client
-        self.perplexity_client = perplexity_client
+        self._openai_client = openai_client
+        self._perplexity_client = perplexity_client
+        self._openai_client_factory = openai_client_factory
+        self._perplexity_client_factory = perplexity_client_factory
         
         # Storage
         self.storage_dir = Path("data/performance_analysis_v2")
@@ -259,8 +441,28 @@ class PerformanceAnalysisEngineV2:
         # Time estimator
         self.time_estimator = DynamicTimeEstimator()
         
+        # (spreadsheet, worksheet) resolved by the last Sheets fetch
+        self._worksheet_cache = None
+        
+        # Content digest of the last saved report (see _save_results)
+        self._last_saved_digest = None
+        
         logger.info("Performance Analysis Engine V2 initialized")
     
+    @property
+    def openai_client(self):
+        """OpenAI client, built from its factory on first access."""
+        if self._openai_client is None and self._openai_client_factory is not None:
+            self._openai_client = self._openai_client_factory()
+        return self._openai_client
+    
+    @property
+    def perplexity_client(self):
+        """Perplexity client, built from its factory on first access."""
+        if self._perplexity_client is None and self._perplexity_client_factory is not None:
+            self._perplexity_client = self._perplexity_client_factory()
+        return self._perplexity_client
+    
     def analyze_performance_period(
         self,
         start_date: str,
@@ -377,12 +579,12 @@ class PerformanceAnalysisEngineV2:
         tickers: Optional[List[str]],
         sheets_integration,
         min_threshold: float
-    ) -> List[StockMovement]:
+    ) -> MovementBatch:
         """
         FAST movement identification using Google Sheets data.
         No slow API calls, just read from sheets.
         """
-        movements = []
+        movements = MovementBatch.empty(end_date)
         
         try:
             # Try to get data from Google Sheets (FAST)
@@ -398,50 +600,55 @@ class PerformanceAnalysisEngineV2:
             
             logger.info(f"Processing {len(df)} stocks from Google Sheets")
             
-            # Process each row
-            for _, row in df.iterrows():
-                try:
-                    ticker = row.get('Ticker', '').strip()
-                    if not ticker:
-                        continue
-                    
-                    # Get percent change
-                    pct_change = self._extract_percent_change(row)
-                    if pct_change is None:
-                        continue
-                    
-                    # Check if meets threshold
-                    if abs(pct_change) < min_threshold:
-                        continue
-                    
-                    # Get prices
-                    start_price, end_price = self._extract_prices(row, pct_change)
-                    
-                    # Determine magnitude
-                    magnitude = self._classify_magnitude(abs(pct_change))
-                    
-                    # Get sector
-                    sector = row.get('Sector', None)
-                    
-                    movement = StockMovement(
-                        ticker=ticker,
-                        price_change_pct=pct_change,
-                        start_price=start_price,
-                        end_price=end_price,
-                        start_date=str(row.get('Analysis Date', start_date)),
-                        end_date=end_date,
-                        magnitude=magnitude,
-                        sector=sector
-                    )
-                    
-                    movements.append(movement)
-                    
-                except Exception as e:
-                    logger.debug(f"Error processing row: {e}")
-                    continue
+            # Vectorized scan: parse the numeric columns once, threshold the
+            # whole frame, and keep the surviving rows as a columnar batch
+            ticker_col = df['Ticker'].str.strip() if 'Ticker' in df.columns else pd.Series('', index=df.index)
             
-            # Sort by absolute change (largest first)
-            movements.sort(key=lambda x: x.change_abs, reverse=True)
+            # Resolve which candidate columns this sheet has, and parse each price column once
+            columns = tuple(df.columns)
+            pct_cols = _present_columns(columns, self.PCT_COLUMNS)
+            start_cols = _present_columns(columns, self.START_PRICE_COLUMNS)
+            end_cols = _present_columns(columns, self.END_PRICE_COLUMNS)
+            prices = {col: _parse_numeric(df[col], ',$') for col in start_cols + end_cols}
+            
+            pct = self._extract_percent_change(df, pct_cols, start_cols, end_cols, prices)
+            
+            mask = ticker_col.fillna('').ne('') & pct.notna() & (pct.abs() >= min_threshold)
+            if mask.any():
+                df = df.loc[mask]
+                pct = pct[mask]
+                start_prices, end_prices = self._extract_prices(
+                    [prices[col][mask] for col in start_cols],
+                    [prices[col][mask] for col in end_cols],
+                    pct
+                )
+                
+                pct_arr = pct.to_numpy(dtype=np.float64)
+                abs_pct = np.abs(pct_arr)
+                magnitudes = np.select([abs_pct >= 20, abs_pct >= 10], [2, 1], 0).astype(np.int8)
+                
+                n = len(df)
+                if 'Sector' in df.columns:
+                    sectors = df['Sector'].to_numpy(dtype=object)
+                else:
+                    sectors = np.full(n, None, dtype=object)
+                if 'Analysis Date' in df.columns:
+                    start_dates = df['Analysis Date'].astype(str).to_numpy(dtype=object)
+                else:
+                    start_dates = np.full(n, str(start_date), dtype=object)
+                
+                # Sort by absolute change (largest first); stable keeps sheet order on ties
+                order = np.argsort(-abs_pct, kind='stable')
+                movements = MovementBatch(
+                    ticker=ticker_col[mask].to_numpy(dtype=object)[order],
+                    pct=pct_arr[order],
+                    start_price=start_prices.to_numpy(dtype=np.float64)[order],
+                    end_price=end_prices.to_numpy(dtype=np.float64)[order],
+                    start_date=start_dates[order],
+                    magnitude=magnitudes[order],
+                    sector=sectors[order],
+                    end_date=end_date
+                )
             
             logger.info(f"Found {len(movements)} movements meeting {min_threshold}% threshold")
             
@@ -462,121 +669,140 @@ class PerformanceAnalysisEngineV2:
             if not sheet:
                 return None
             
-            # Try common worksheet names
-            worksheet = None
-            for name in ['Historical Price Analysis', 'Portfolio Analysis', 'Price Analysis']:
-                try:
-                    worksheet = sheet.worksheet(name)
-                    break
-                except:
-                    continue
+            # Reuse the worksheet resolved on a previous call for this spreadsheet
+            cached = self._worksheet_cache
+            if cached is not None and cached[0] is sheet:
+                worksheet = cached[1]
+            else:
+                # Try common worksheet names
+                worksheet = None
+                for name in ['Historical Price Analysis', 'Portfolio Analysis', 'Price Analysis']:
+                    try:
+                        worksheet = sheet.worksheet(name)
+                        break
+                    except:
+                        continue
+                
+                if not worksheet:
+                    return None
+                self._worksheet_cache = (sheet, worksheet)
             
-            if not worksheet:
-                return None
+            # Reuse the local snapshot while the spreadsheet is unmodified
+            cache_file = self._sheets_cache_file(sheet, worksheet)
+            if cache_file is not None and cache_file.exists():
+                try:
+                    df = pd.read_pickle(cache_file)
+                    logger.info(f"Loaded {len(df)} rows from Sheets cache ({cache_file.name})")
+                    return df
+                except Exception as e:
+                    logger.debug(f"Sheets cache read failed: {e}")
             
-            # Get all data at once (FAST)
-            data = worksheet.get_all_records()
-            if not data:
+            # Get all data at once as raw cell strings (FAST); numeric columns are
+            # parsed column-wise later, so skip get_all_records' per-cell dicts
+            values = worksheet.get_all_values()
+            if len(values) < 2:
                 return None
             
-            df = pd.DataFrame(data)
+            df = pd.DataFrame(values[1:], columns=values[0])
             df.columns = df.columns.str.strip()
             
             logger.info(f"Fetched {len(df)} rows from Google Sheets")
+            if cache_file is not None:
+                self._save_sheets_cache(df, cache_file)
             return df
             
         except Exception as e:
             logger.debug(f"Sheets fetch error: {e}")
+            self._worksheet_cache = None  # Re-resolve the worksheet next time
             return None
     
-    def _extract_percent_change(self, row: pd.Series) -> Optional[float]:
+    def _sheets_cache_file(self, sheet, worksheet) -> Optional[Path]:
         """
-        Extract percent change from row, trying multiple column names.
+        Cache path keyed by worksheet id and the spreadsheet's Drive modifiedTime,
+        or None when the revision can't be determined (caching disabled).
         """
-        # Try direct percent change column
-        for col in ['Percent Change', 'Price Change %', '% Change', 'Percent_Change']:
-            if col in row.index:
-                val = row[col]
-                if val is None or (isinstance(val, str) and val.strip() == ''):
-                    continue
-                
-                try:
-                    # Handle numeric or string
-                    if isinstance(val, (int, float)):
-                        return float(val)
-                    
-                    # Parse string
-                    val_str = str(val).strip().replace('%', '').replace(',', '')
-                    if val_str and val_str.lower() not in ['nan', 'n/a', '-', 'none']:
-                        return float(val_str)
-                except:
-                    continue
-        
-        # Calculate from prices if available
-        for price_col in ['Price at Analysis', 'Price_at_Analysis']:
-            for current_col in ['Price', 'Current Price']:
-                if price_col in row.index and current_col in row.index:
-                    try:
-                        price_at = float(str(row[price_col]).replace(',', '').replace('$', ''))
-                        price_now = float(str(row[current_col]).replace(',', '').replace('$', ''))
-                        
-                        if price_at > 0:
-                            return ((price_now - price_at) / price_at) * 100
-                    except:
-                        continue
-        
-        return None
+        try:
+            modified = sheet.get_lastUpdateTime()
+        except Exception as e:
+            logger.debug(f"Could not read spreadsheet modified time: {e}")
+            return None
+        if not modified:
+            return None
+        revision = re.sub(r'[^0-9A-Za-z]', '', str(modified))
+        return self.storage_dir / f"sheets_{worksheet.id}_{revision}.pkl"
     
-    def _extract_prices(self, row: pd.Series, pct_change: float) -> Tuple[float, float]:
-        """Extract start and end prices, or estimate from percent change."""
-        start_price = 0.0
-        end_price = 0.0
+    def _save_sheets_cache(self, df: pd.DataFrame, cache_file: Path):
+        """Write the sheet snapshot and prune snapshots of older revisions."""
+        try:
+            df.to_pickle(cache_file)
+            prefix = cache_file.name.rsplit('_', 1)[0]
+            for old_file in self.storage_dir.glob(f"{prefix}_*.pkl"):
+                if old_file != cache_file:
+                    old_file.unlink(missing_ok=True)
+        except Exception as e:
+            logger.debug(f"Sheets cache write failed: {e}")
+    
+    def _extract_percent_change(
+        self,
+        df: pd.DataFrame,
+        pct_cols: Tuple[str, ...],
+        start_cols: Tuple[str, ...],
+        end_cols: Tuple[str, ...],
+        prices: Dict[str, pd.Series]
+    ) -> pd.Series:
+        """
+        Percent change per row: first parseable percent-change column,
+        else computed from analysis/current prices. NaN where unavailable.
+        """
+        pct = pd.Series(np.nan, index=df.index)
         
-        # Try to get actual prices
-        for col in ['Price at Analysis', 'Price_at_Analysis']:
-            if col in row.index:
-                try:
-                    val = str(row[col]).replace(',', '').replace('$', '').strip()
-                    if val and val.lower() not in ['nan', 'n/a', '-']:
-                        start_price = float(val)
-                        break
-                except:
-                    continue
+        # Try direct percent change columns, in priority order
+        for col in pct_cols:
+            pct = pct.fillna(_parse_numeric(df[col], '%,'))
         
-        for col in ['Price', 'Current Price']:
-            if col in row.index:
-                try:
-                    val = str(row[col]).replace(',', '').replace('$', '').strip()
-                    if val and val.lower() not in ['nan', 'n/a', '-']:
-                        end_price = float(val)
-                        break
-                except:
-                    continue
+        # Calculate from prices where no direct value parsed
+        for price_col in start_cols:
+            price_at = prices[price_col]
+            for current_col in end_cols:
+                computed = ((prices[current_col] - price_at) / price_at) * 100
+                pct = pct.fillna(computed.where(price_at > 0))
+        
+        return pct
+    
+    def _extract_prices(
+        self,
+        start_candidates: List[pd.Series],
+        end_candidates: List[pd.Series],
+        pct_change: pd.Series
+    ) -> Tuple[pd.Series, pd.Series]:
+        """Extract start and end prices from parsed price columns, or estimate from percent change."""
+        start_price = pd.Series(np.nan, index=pct_change.index)
+        end_price = pd.Series(np.nan, index=pct_change.index)
+        
+        # Use the first actual price available, in column priority order
+        for parsed in start_candidates:
+            start_price = start_price.fillna(parsed)
+        for parsed in end_candidates:
+            end_price = end_price.fillna(parsed)
+        start_price = start_price.fillna(0.0)
+        end_price = end_price.fillna(0.0)
         
         # Calculate missing price from the other
-        if start_price > 0 and end_price == 0:
-            end_price = start_price * (1 + pct_change / 100)
-        elif end_price > 0 and start_price == 0:
-            start_price = end_price / (1 + pct_change / 100)
-        elif start_price == 0 and end_price == 0:
-            # Use arbitrary baseline
-            start_price = 100.0
-            end_price = start_price * (1 + pct_change / 100)
+        growth = 1 + pct_change / 100
+        only_start = (start_price > 0) & (end_price == 0)
+        only_end = (end_price > 0) & (start_price == 0)
+        neither = (start_price == 0) & (end_price == 0)
+        end_price = end_price.mask(only_start, start_price * growth)
+        start_price = start_price.mask(only_end, end_price / growth)
+        # Use arbitrary baseline
+        start_price = start_price.mask(neither, 100.0)
+        end_price = end_price.mask(neither, 100.0 * growth)
         
         return start_price, end_price
     
-    def _classify_magnitude(self, abs_change: float) -> str:
-        """Classify movement magnitude."""
-        if abs_change >= 20:
-            return "extreme"
-        elif abs_change >= 10:
-            return "major"
-        else:
-            return "significant"
-    
     def _analyze_movements_fast(
         self,
-        movements: List[StockMovement],
+        movements: MovementBatch,
         progress_callback=None,
         total_movements: int = 0
     ) -> List[MovementInsight]:
@@ -586,11 +812,19 @@ class PerformanceAnalysisEngineV2:
         """
         insights = []
         total = len(movements)
+        last_index = total - 1
+        last_emit = float('-inf')
         
-        for i, movement in enumerate(movements):
+        # Iterate the batch columns directly; no StockMovement views needed
+        rows = zip(movements.ticker.tolist(), movements.pct.tolist(), movements.magnitude.tolist())
+        for i, (ticker, pct_change, magnitude) in enumerate(rows):
             try:
-                # Update progress with dynamic time estimate
-                if progress_callback and i % 3 == 0:  # Update every 3 movements
+                # Update progress with dynamic time estimate, throttled by wall
+                # clock (heuristic insights take microseconds each); always
+                # report the first and last movement
+                now = time.perf_counter() if progress_callback else 0.0
+                if progress_callback and (now - last_emit >= self.PROGRESS_INTERVAL or i == last_index):
+                    last_emit = now
                     progress_pct = i / total
                     progress_display = 40 + int(progress_pct * 30)
                     time_remaining = self.time_estimator.estimate_remaining(
@@ -599,69 +833,42 @@ class PerformanceAnalysisEngineV2:
                         total
                     )
                     
-                    # Build detailed status message
-                    analyzed_count = i
-                    remaining_count = total - i
-                    pct_change = movement.price_change_pct
-                    direction = "gained" if pct_change > 0 else "lost"
-                    
-                    status_msg = (f"Analyzing {movement.ticker} ({analyzed_count + 1}/{total}) - "
-                                f"Stock {direction} {abs(pct_change):.1f}% | "
-                                f"{remaining_count} stocks remaining...")
+                    # Build detailed status message (only when it will be emitted)
+                    status_msg = self.STATUS_TEMPLATE.format(
+                        ticker=ticker,
+                        position=i + 1,
+                        total=total,
+                        direction="gained" if pct_change > 0 else "lost",
+                        pct=abs(pct_change),
+                        remaining=total - i
+                    )
                     
                     progress_callback(status_msg, progress_display, time_remaining)
                 
                 # Quick analysis based on patterns
-                insight = self._quick_insight(movement)
-                insights.append(insight)
+                insights.append(self._insight_for(ticker, pct_change, magnitude))
                 
             except Exception as e:
-                logger.debug(f"Error analyzing {movement.ticker}: {e}")
+                logger.debug(f"Error analyzing {ticker}: {e}")
                 continue
         
         return insights
     
-    def _quick_insight(self, movement: StockMovement) -> MovementInsight:
-        """
-        Generate quick insight using heuristics (no slow API calls).
-        """
-        ticker = movement.ticker
-        pct = movement.price_change_pct
+    def _insight_for(self, ticker: str, pct: float, magnitude: int) -> MovementInsight:
+        """Heuristic insight from the per-magnitude table (magnitude is a MovementBatch code)."""
+        catalyst_type, confidence, explanation, actionable = self.INSIGHT_TABLE[magnitude]
         direction = "up" if pct > 0 else "down"
-        
-        # Determine likely catalyst type based on magnitude and patterns
-        if movement.magnitude == "extreme":
-            # Extreme moves are usually earnings or major news
-            catalyst_type = "earnings_or_news"
-            confidence = 4
-            summary = f"{ticker} moved {direction} {abs(pct):.1f}% - likely earnings report or major company news."
-            actionable = "Increase sentiment agent weight to catch major news events earlier."
-            
-        elif movement.magnitude == "major":
-            # Major moves could be analyst actions, sector trends, or business developments
-            catalyst_type = "analyst_or_sector"
-            confidence = 3
-            summary = f"{ticker} moved {direction} {abs(pct):.1f}% - possible analyst upgrade/downgrade or sector momentum."
-            actionable = "Monitor analyst ratings and sector trends more closely."
-            
-        else:
-            # Significant moves are often technical or gradual accumulation
-            catalyst_type = "technical"
-            confidence = 2
-            summary = f"{ticker} moved {direction} {abs(pct):.1f}% - technical momentum or gradual trend."
-            actionable = "Consider momentum indicators and technical analysis in scoring."
-        
         return MovementInsight(
             ticker=ticker,
             catalyst_type=catalyst_type,
             confidence=confidence,
-            summary=summary,
+            summary=f"{ticker} moved {direction} {abs(pct):.1f}% - {explanation}",
             actionable=actionable
         )
     
     def _generate_recommendations_fast(
         self,
-        movements: List[StockMovement],
+        movements: MovementBatch,
         insights: List[MovementInsight]
     ) -> List[Dict[str, Any]]:
         """
@@ -671,34 +878,47 @@ class PerformanceAnalysisEngineV2:
         
         # Analyze patterns
         total = len(movements)
-        up_count = sum(1 for m in movements if m.direction == "up")
+        up_count = movements.up_count
         down_count = total - up_count
-        extreme_count = sum(1 for m in movements if m.magnitude == "extreme")
+        extreme_count = movements.extreme_count
+        
+        # Pattern-based recommendations. Heuristic insights are a pure function
+        # of magnitude, so when every movement produced one the catalyst counts
+        # come from the magnitude column without another pass over insights
+        if len(insights) == total:
+            magnitude_counts = np.bincount(movements.magnitude, minlength=len(self.INSIGHT_TABLE))
+            catalyst_types = {
+                self.INSIGHT_TABLE[code][0]: int(count)
+                for code, count in enumerate(magnitude_counts.tolist()) if count
+            }
+        else:
+            catalyst_types = {}
+            for insight in insights:
+                catalyst_types[insight.catalyst_type] = catalyst_types.get(insight.catalyst_type, 0) + 1
         
-        # Pattern-based recommendations
-        catalyst_types = {}
-        for insight in insights:
-            catalyst_types[insight.catalyst_type] = catalyst_types.get(insight.catalyst_type, 0) + 1
+        news_count = catalyst_types.get('earnings_or_news', 0)
+        news_ratio = news_count / total
+        sector_count = catalyst_types.get('analyst_or_sector', 0)
         
         # Recommendation 1: Agent weight adjustments
-        if catalyst_types.get('earnings_or_news', 0) / total > 0.3:
+        if news_ratio > 0.3:
             recommendations.append({
                 'priority': 'high',
                 'category': 'agent_weight',
                 'title': 'Increase Sentiment Agent Weight',
-                'description': f'{catalyst_types.get("earnings_or_news", 0)} of {total} movements ({catalyst_types.get("earnings_or_news", 0)/total*100:.0f}%) were driven by earnings/news events.',
+                'description': f'{news_count} of {total} movements ({news_ratio*100:.0f}%) were driven by earnings/news events.',
                 'action': 'Increase sentiment agent weight by 20% (1.0 → 1.2)',
                 'expected_impact': 'Faster reaction to breaking news and earnings reports',
                 'confidence': 85
             })
         
         # Recommendation 2: Sector momentum
-        if catalyst_types.get('analyst_or_sector', 0) / total > 0.25:
+        if sector_count / total > 0.25:
             recommendations.append({
                 'priority': 'medium',
                 'category': 'feature_focus',
                 'title': 'Enhance Sector Analysis',
-                'description': f'{catalyst_types.get("analyst_or_sector", 0)} movements appeared sector-driven.',
+                'description': f'{sector_count} movements appeared sector-driven.',
                 'action': 'Add sector rotation tracking and peer comparison',
                 'expected_impact': 'Better capture of sector trends and relative strength',
                 'confidence': 75
@@ -729,15 +949,16 @@ class PerformanceAnalysisEngineV2:
                 'confidence': 70
             })
         
-        # Sort by priority
-        priority_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        recommendations.sort(key=lambda x: (priority_order.get(x['priority'], 4), -x['confidence']))
+        # Sort by priority; each key is built once and compared via itemgetter
+        priority_order = self.PRIORITY_ORDER
+        keyed = [((priority_order.get(r['priority'], 4), -r['confidence']), r) for r in recommendations]
+        keyed.sort(key=itemgetter(0))
         
-        return recommendations
+        return [r for _, r in keyed]
     
     def _create_report(
         self,
-        movements: List[StockMovement],
+        movements: MovementBatch,
         insights: List[MovementInsight],
         recommendations: List[Dict],
         start_date: str,
@@ -745,54 +966,51 @@ class PerformanceAnalysisEngineV2:
     ) -> Dict[str, Any]:
         """Create comprehensive but clean report."""
         # Top movers
-        up_moves = [m for m in movements if m.direction == "up"]
-        down_moves = [m for m in movements if m.direction == "down"]
+        pct = movements.pct
+        up_idx = np.flatnonzero(pct > 0)
+        down_idx = np.flatnonzero(pct <= 0)
         
-        top_gainers = sorted(up_moves, key=lambda x: x.price_change_pct, reverse=True)[:10]
-        top_losers = sorted(down_moves, key=lambda x: x.price_change_pct)[:10]
+        # Top-10 selection rather than full sorts; ties keep the existing |change| order
+        top_gainers = movements.take(up_idx[_smallest_k(-pct[up_idx], 10)])
+        top_losers = movements.take(down_idx[_smallest_k(pct[down_idx], 10)])
         
-        # Executive summary
-        exec_summary = self._create_executive_summary(movements, insights, recommendations)
+        # Counts are taken once here and shared with the executive summary
+        up_count = len(up_idx)
+        down_count = len(down_idx)
+        extreme_count = movements.extreme_count
+        exec_summary = self._create_executive_summary(
+            recommendations, total=len(movements), up=up_count, down=down_count, extreme=extreme_count
+        )
         
-        report = {
-            'report_id': datetime.now().strftime("%Y%m%d%H%M%S"),
-            'generated_at': datetime.now().isoformat(),
-            'period': {
-                'start_date': start_date,
-                'end_date': end_date
-            },
-            'summary': {
-                'total_movements': len(movements),
-                'up_movements': len(up_moves),
-                'down_movements': len(down_moves),
-                'extreme_movements': sum(1 for m in movements if m.magnitude == "extreme"),
-                'recommendations_count': len(recommendations)
-            },
-            'executive_summary': exec_summary,
-            'top_gainers': [asdict(m) for m in top_gainers],
-            'top_losers': [asdict(m) for m in top_losers],
-            'insights': [asdict(i) for i in insights],
-            'recommendations': recommendations,
-            'metadata': {
-                'engine_version': '2.0',
-                'analysis_duration_ms': 0  # Will be updated if tracked
-            }
+        report = self._base_report(start_date, end_date)
+        report['summary'] = {
+            'total_movements': len(movements),
+            'up_movements': up_count,
+            'down_movements': down_count,
+            'extreme_movements': extreme_count,
+            'recommendations_count': len(recommendations)
+        }
+        report['executive_summary'] = exec_summary
+        report['top_gainers'] = [_shallow_asdict(m) for m in top_gainers]
+        report['top_losers'] = [_shallow_asdict(m) for m in top_losers]
+        report['insights'] = [_shallow_asdict(i) for i in insights]
+        report['recommendations'] = recommendations
+        report['metadata'] = {
+            'engine_version': '2.0',
+            'analysis_duration_ms': 0  # Will be updated if tracked
         }
         
         return report
     
     def _create_executive_summary(
         self,
-        movements: List[StockMovement],
-        insights: List[MovementInsight],
-        recommendations: List[Dict]
+        recommendations: List[Dict],
+        total: int,
+        up: int,
+        down: int,
+        extreme: int
     ) -> str:
-        """Generate concise executive summary."""
-        total = len(movements)
-        up = sum(1 for m in movements if m.direction == "up")
-        down = total - up
-        extreme = sum(1 for m in movements if m.magnitude == "extreme")
-        
+        """Generate concise executive summary from precomputed movement counts."""
         parts = []
         parts.append(f"Analyzed {total} significant stock movements ({up} up, {down} down).")
         
@@ -800,8 +1018,12 @@ class PerformanceAnalysisEngineV2:
             parts.append(f"{extreme} extreme movements (>20%) detected, indicating high volatility.")
         
         if recommendations:
-            critical = sum(1 for r in recommendations if r['priority'] == 'critical')
-            high = sum(1 for r in recommendations if r['priority'] == 'high')
+            critical = high = 0
+            for r in recommendations:
+                if r['priority'] == 'critical':
+                    critical += 1
+                elif r['priority'] == 'high':
+                    high += 1
             
             if critical > 0:
                 parts.append(f"{critical} CRITICAL recommendations require immediate attention.")
@@ -814,12 +1036,13 @@ class PerformanceAnalysisEngineV2:
         
         return " ".join(parts)
     
-    def _create_empty_report(self, start_date: str, end_date: str, threshold: float) -> Dict:
-        """Create report when no movements found."""
+    @staticmethod
+    def _base_report(start_date: str, end_date: str) -> Dict[str, Any]:
+        """Report skeleton shared by every builder: one timestamp, zeroed summary, empty lists."""
+        now = datetime.now()  # one timestamp so report_id and generated_at agree
         return {
-            'report_id': datetime.now().strftime("%Y%m%d%H%M%S"),
-            'status': 'no_movements',
-            'message': f'No stocks moved ≥{threshold}% in this period. Try lowering the threshold or expanding the date range.',
+            'report_id': now.strftime("%Y%m%d%H%M%S"),
+            'generated_at': now.isoformat(),
             'period': {'start_date': start_date, 'end_date': end_date},
             'summary': {
                 'total_movements': 0,
@@ -828,68 +1051,97 @@ class PerformanceAnalysisEngineV2:
                 'extreme_movements': 0,
                 'recommendations_count': 0
             },
-            'executive_summary': 'No significant movements detected in analysis period.',
+            'executive_summary': '',
             'top_gainers': [],
             'top_losers': [],
             'insights': [],
             'recommendations': []
         }
     
+    def _create_empty_report(self, start_date: str, end_date: str, threshold: float) -> Dict:
+        """Create report when no movements found."""
+        report = self._base_report(start_date, end_date)
+        report['status'] = 'no_movements'
+        report['message'] = f'No stocks moved ≥{threshold}% in this period. Try lowering the threshold or expanding the date range.'
+        report['executive_summary'] = 'No significant movements detected in analysis period.'
+        return report
+    
     def _create_error_report(self, error_msg: str, start_date: str, end_date: str) -> Dict:
         """Create report when analysis fails."""
-        return {
-            'report_id': datetime.now().strftime("%Y%m%d%H%M%S"),
-            'status': 'error',
-            'error': error_msg,
-            'message': f'Analysis failed: {error_msg}',
-            'period': {'start_date': start_date, 'end_date': end_date},
-            'summary': {
-                'total_movements': 0,
-                'up_movements': 0,
-                'down_movements': 0,
-                'extreme_movements': 0,
-                'recommendations_count': 0
-            },
-            'executive_summary': f'Analysis failed: {error_msg}',
-            'top_gainers': [],
-            'top_losers': [],
-            'insights': [],
-            'recommendations': []
-        }
+        report = self._base_report(start_date, end_date)
+        report['status'] = 'error'
+        report['error'] = error_msg
+        report['message'] = f'Analysis failed: {error_msg}'
+        report['executive_summary'] = f'Analysis failed: {error_msg}'
+        return report
     
     def _save_results(self, report: Dict):
-        """Save analysis results to storage."""
+        """
+        Save analysis results to storage.
+        
+        A report identical to the last one saved (ignoring its id/timestamp) is
+        not written again: latest_report.json keeps the earlier copy and the
+        repeat run is not recorded in report_history.jsonl.
+        """
         try:
+            # The compact content bytes serve both as the change digest and as
+            # the body of the history line (no extra serialization for the check)
+            volatile = {k: v for k, v in report.items() if k in self.REPORT_VOLATILE_KEYS}
+            content = {k: v for k, v in report.items() if k not in self.REPORT_VOLATILE_KEYS}
+            body = _json_dumps(content, pretty=False)
+            digest = hashlib.blake2b(body, digest_size=16).digest()
+            if digest == self._last_saved_digest:
+                logger.info("Report unchanged since last save; skipping write")
+                return
+            
             # Save latest report
             report_file = self.storage_dir / "latest_report.json"
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            _atomic_write_bytes(report_file, _json_dumps(report))
             
-            # Save to history
-            history_file = self.storage_dir / "report_history.json"
-            history = []
-            if history_file.exists():
-                with open(history_file, 'r') as f:
-                    history = json.load(f)
+            # Save to history: append one JSON line instead of rewriting the archive
+            history_file = self.storage_dir / "report_history.jsonl"
+            self._migrate_legacy_history(history_file)
+            line = body
+            if volatile:
+                head = _json_dumps(volatile, pretty=False)
+                line = head if body == b'{}' else head[:-1] + b',' + body[1:]
+            with open(history_file, 'ab') as f:
+                f.write(line + b'\n')
             
-            history.append(report)
-            history = history[-50:]  # Keep last 50 reports
-            
-            with open(history_file, 'w') as f:
-                json.dump(history, f, indent=2, default=str)
+            # Trim lazily, once the file has grown well past the retention limit
+            if history_file.stat().st_size > self.REPORT_HISTORY_TRIM_BYTES:
+                self._trim_history(history_file)
             
+            self._last_saved_digest = digest
             logger.info(f"Saved report to {report_file}")
             
         except Exception as e:
             logger.error(f"Failed to save results: {e}")
     
+    def _trim_history(self, history_file: Path):
+        """Keep only the last REPORT_HISTORY_LIMIT reports (atomic rewrite)."""
+        lines = history_file.read_bytes().splitlines(keepends=True)
+        if len(lines) > self.REPORT_HISTORY_LIMIT:
+            _atomic_write_bytes(history_file, b''.join(lines[-self.REPORT_HISTORY_LIMIT:]))
+    
+    def _migrate_legacy_history(self, history_file: Path):
+        """One-time conversion of the old report_history.json array to JSON lines."""
+        legacy_file = self.storage_dir / "report_history.json"
+        if history_file.exists() or not legacy_file.exists():
+            return
+        try:
+            history = _json_loads(legacy_file.read_bytes())[-self.REPORT_HISTORY_LIMIT:]
+            history_file.write_bytes(b''.join(_json_dumps(r, pretty=False) + b'\n' for r in history))
+            legacy_file.unlink()
+        except Exception as e:
+            logger.warning(f"Could not migrate legacy report history: {e}")
+    
     def get_latest_report(self) -> Optional[Dict]:
         """Get the most recent analysis report."""
         try:
             report_file = self.storage_dir / "latest_report.json"
             if report_file.exists():
-                with open(report_file, 'r') as f:
-                    return json.load(f)
+                return _json_loads(report_file.read_bytes())
         except Exception as e:
             logger.error(f"Error loading latest report: {e}")
         return None
@@ -909,8 +1161,7 @@ class PerformanceAnalysisEngineV2:
             # Load existing tracking data
             tracking_data = {'implemented_recommendations': []}
             if tracking_file.exists():
-                with open(tracking_file, 'r') as f:
-                    tracking_data = json.load(f)
+                tracking_data = _json_loads(tracking_file.read_bytes())
             
             # Create implementation record
             implementation_record = {
@@ -928,8 +1179,7 @@ class PerformanceAnalysisEngineV2:
             tracking_data['implemented_recommendations'].append(implementation_record)
             
             # Save tracking data
-            with open(tracking_file, 'w') as f:
-                json.dump(tracking_data, f, indent=2, default=str)
+            _atomic_write_bytes(tracking_file, _json_dumps(tracking_data))
             
             logger.info(f"Marked recommendation {recommendation_id} as implemented")
             
@@ -6,15 +6,70 @@ Resolves API keys from multiple sources with a clear precedence:
 """
 
 import os
-import streamlit as st
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
+
+
+@lru_cache(maxsize=1)
+def _st():
+    """Streamlit, imported on first use; None when it isn't installed.
+
+    Keeps the heavy Streamlit import off the path of CLI scripts, tests and
+    background jobs that only need env-var keys.
+    """
+    try:
+        import streamlit as st
+    except ImportError:
+        return None
+    return st
+
+
+# Secrets/env keys already resolved; only found keys are stored, so a key
+# added to secrets.toml later (Streamlit reloads it) is still picked up
+_resolved_keys: Dict[str, str] = {}
+
+
+def _configured_key(key_name: str) -> Optional[str]:
+    """Key from Streamlit Secrets, else the environment; found keys are cached per process.
+
+    Secrets and env vars are process-wide, so once a key is found its secrets
+    lookup (and KeyError control flow) isn't repeated. Missing keys are looked
+    up again on every call. Call clear_key_cache() after changing or removing
+    a key at runtime.
+    """
+    value = _resolved_keys.get(key_name)
+    if value is not None:
+        return value
+
+    value = None
+    # Streamlit Secrets (secrets.toml or Streamlit Cloud)
+    st = _st()
+    if st is not None:
+        try:
+            value = st.secrets[key_name]
+        except (FileNotFoundError, KeyError, AttributeError):
+            pass
+
+    # Environment variable (.env via python-dotenv)
+    if value is None:
+        value = os.getenv(key_name)
+
+    if value is not None:
+        _resolved_keys[key_name] = value
+    return value
+
+
+def clear_key_cache() -> None:
+    """Forget resolved Secrets/env keys so the next lookup re-reads them."""
+    _resolved_keys.clear()
 
 
 class TierManager:
     """Resolves API keys from session state, Streamlit Secrets, or env vars."""
 
     def __init__(self):
-        if 'user_api_keys' not in st.session_state:
+        st = _st()
+        if st is not None and 'user_api_keys' not in st.session_state:
             st.session_state.user_api_keys = {}
 
     def get_api_key(self, key_name: str) -> Optional[str]:
@@ -27,15 +82,11 @@ class TierManager:
             The resolved key string, or None if not found anywhere.
         """
         # 1. Session-provided keys (e.g. set programmatically)
-        user_keys = st.session_state.get('user_api_keys', {})
-        if user_keys.get(key_name):
-            return user_keys[key_name]
-
-        # 2. Streamlit Secrets (secrets.toml or Streamlit Cloud)
-        try:
-            return st.secrets[key_name]
-        except (FileNotFoundError, KeyError, AttributeError):
-            pass
+        st = _st()
+        if st is not None:
+            user_keys = st.session_state.get('user_api_keys', {})
+            if user_keys.get(key_name):
+                return user_keys[key_name]
 
-        # 3. Environment variable (.env via python-dotenv)
-        return os.getenv(key_name)
+        # 2. Streamlit Secrets, 3. environment variable (cached per key name)
+        return _configured_key(key_name)